@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Benchmark key points served by a run-wide KeyPointStore.
+
+Each synthetic email is read the way the pipeline reads it: key points for
+the Notion export, then again for the report, each through its own
+EmailArtifacts sharing one store. Then a new run with a fresh store
+reads the same emails from the on-disk SummaryCache the first run wrote.
+Each engine in SUMMARIZERS then runs through a store of its own, and
+finally a store with CorpusStats that have counted every email first,
+as the pipeline does for --corpus-stats.
+
+Reports the time per email and checks that the shared store is the one
+used, that every email is summarized once, that the rerun is served
+entirely from the cache with the same key points, that each store's key
+points come from the engine it was asked for, and that the footer every
+email shares is dropped before summarizing.
+
+Usage: python benchmarks/bench_key_point_store.py [--emails 200] [--sentences 3]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import eml_parser.summarizer as summarizer
+from eml_parser.corpus_stats import CorpusStats
+from eml_parser.extractor import EmailArtifacts
+from eml_parser.parser import ParsedEmail
+from eml_parser.report import build_report_entry
+from eml_parser.summarizer import SUMMARIZERS, KeyPointStore, get_engine
+from eml_parser.summary_cache import SummaryCache
+
+_VOCABULARY = (
+    "release deploy server database migration customer invoice report budget "
+    "quarter meeting schedule update security patch version network latency "
+    "storage backup incident review project deadline team feature request"
+).split()
+
+# Appended to every email: boilerplate for --corpus-stats
+FOOTER = "You receive this update because you are on the release team list for the project."
+
+
+def make_emails(email_count: int, seed: int = 0) -> list[ParsedEmail]:
+    """Plain-text emails of 10 to 40 sentences, one paragraph per line, plus FOOTER."""
+    rng = random.Random(seed)
+    emails = []
+    for i in range(email_count):
+        lines = [
+            f"Note {j} on the {' '.join(rng.choices(_VOCABULARY, k=rng.randint(6, 14)))}."
+            for j in range(rng.randint(10, 40))
+        ]
+        emails.append(ParsedEmail(
+            filepath=Path(f"email_{i:05d}.eml"),
+            subject=f"Update {i}",
+            sender="ops@example.com",
+            recipients=["team@example.com"],
+            date=None,
+            plain_body="\n\n".join(lines + [FOOTER]),
+            html_body="",
+        ))
+    return emails
+
+
+class _CountingSummarizer:
+    """Count calls to extract_key_points made through the store, keeping the texts."""
+
+    def __init__(self):
+        self.calls = 0
+        self.texts = []
+        self._extract = summarizer.extract_key_points
+
+    def __call__(self, text, *args, **kwargs):
+        self.calls += 1
+        self.texts.append(text)
+        return self._extract(text, *args, **kwargs)
+
+    def __enter__(self):
+        summarizer.extract_key_points = self
+        return self
+
+    def __exit__(self, *exc):
+        summarizer.extract_key_points = self._extract
+
+
+def export_and_report(
+    emails: list[ParsedEmail], store: KeyPointStore, sentences: int,
+) -> tuple[float, list[list[str]]]:
+    """Read key points for Notion, then build report entries.
+
+    Returns the seconds taken and the key points per email.
+    """
+    start = time.perf_counter()
+    key_points = []
+    for email in emails:
+        artifacts = EmailArtifacts(email, store)
+        assert artifacts.key_point_store is store, "EmailArtifacts replaced the shared store"
+        notion_points = artifacts.key_points(sentences)
+        entry = build_report_entry(email, None, sentences, artifacts=EmailArtifacts(email, store))
+        assert entry.key_points == notion_points, "report and Notion key points differ"
+        key_points.append(entry.key_points)
+    return time.perf_counter() - start, key_points
+
+
+def report(label: str, seconds: float, emails: int, calls: int) -> None:
+    print(f"{label:<14} {seconds:8.3f} s  {seconds / emails * 1000:7.2f} ms/email  {calls} summarizations")
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--emails", type=int, default=200)
+    arg_parser.add_argument("--sentences", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    emails = make_emails(args.emails)
+    print(f"{len(emails)} emails, {args.sentences} key points each")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = Path(tmp) / "summaries.sqlite"
+
+        with SummaryCache(cache_path) as cache, _CountingSummarizer() as counter:
+            store = KeyPointStore(cache)
+            seconds, first = export_and_report(emails, store, args.sentences)
+        assert len(store) == len(emails), "the shared store was not filled"
+        assert counter.calls == len(emails), f"{counter.calls} summarizations for {len(emails)} emails"
+        report("shared store", seconds, len(emails), counter.calls)
+
+        # A new run: fresh store, same cache file
+        with SummaryCache(cache_path) as cache, _CountingSummarizer() as counter:
+            seconds, rerun = export_and_report(emails, KeyPointStore(cache), args.sentences)
+        assert counter.calls == 0, f"{counter.calls} summarizations despite the summary cache"
+        assert rerun == first, "cached key points differ"
+        report("cached rerun", seconds, len(emails), counter.calls)
+
+    results = {}
+    for algorithm in SUMMARIZERS:
+        with _CountingSummarizer() as counter:
+            seconds, results[algorithm] = export_and_report(
+                emails, KeyPointStore(algorithm=algorithm), args.sentences,
+            )
+        engine = get_engine(algorithm)
+        expected = [
+            engine.summarize(EmailArtifacts(email).summary_text, args.sentences) for email in emails
+        ]
+        assert results[algorithm] == expected, f"key points did not come from {algorithm}"
+        report(algorithm, seconds, len(emails), counter.calls)
+    assert len({str(points) for points in results.values()}) > 1, "every engine gave the same key points"
+
+    with CorpusStats() as stats, _CountingSummarizer() as counter:
+        start = time.perf_counter()
+        for email in emails:
+            stats.observe(EmailArtifacts(email).summary_text)
+        export_and_report(emails, KeyPointStore(corpus_stats=stats), args.sentences)
+        seconds = time.perf_counter() - start
+    assert counter.calls == len(emails)
+    assert not any(FOOTER in text for text in counter.texts), "boilerplate reached the summarizer"
+    report("corpus stats", seconds, len(emails), counter.calls)
+
+
+if __name__ == "__main__":
+    main()
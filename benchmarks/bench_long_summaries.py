@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Benchmark bounded vs unbounded LSA on synthetic long documents.
+
+Usage: python benchmarks/bench_long_summaries.py [--sizes 100,500,1000,3000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from eml_parser.summarizer import SummarizerEngine
+
+_VOCABULARY = (
+    "release deploy server database migration customer invoice report budget "
+    "quarter meeting schedule update security patch version network latency "
+    "storage backup incident review project deadline team feature request"
+).split()
+
+
+def make_document(sentence_count: int, seed: int = 0) -> str:
+    """Generate a digest-like text with the given number of sentences."""
+    rng = random.Random(seed)
+    sentences = []
+    for i in range(sentence_count):
+        words = rng.choices(_VOCABULARY, k=rng.randint(8, 20))
+        sentences.append(f"Item {i} covers the {' '.join(words)}.")
+    return " ".join(sentences)
+
+
+def timed(engine: SummarizerEngine, text: str) -> float:
+    start = time.perf_counter()
+    engine.summarize(text, 3)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--sizes", default="100,500,1000,3000")
+    args = arg_parser.parse_args()
+
+    bounded = SummarizerEngine()
+    unbounded = SummarizerEngine(max_chars=None, max_sentences=None)
+
+    print(f"{'sentences':>10} {'unbounded':>12} {'bounded':>12}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        text = make_document(size)
+        print(f"{size:>10} {timed(unbounded, text):>11.3f}s {timed(bounded, text):>11.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Benchmark Notion export throughput against a local stand-in server.
+
+Starts the stand-in from notion_standin.py with the given latency, random
+429s and server rate limit, then exports the same synthetic emails with
+each worker count through connect_notion_target and NotionExporter, the
+code path of `run.py --notion`. Each round starts from an empty database
+and is exported twice: every email must be created exactly once, and the
+second pass must find them all as duplicates.
+
+Usage: python benchmarks/bench_notion_export.py [--emails 30] [--workers 1,2,4,8]
+           [--rate 3] [--server-rate 3] [--latency 0.3] [--jitter 0.1]
+           [--throttle 0] [--pdfs]
+"""
+
+import argparse
+import hashlib
+import logging
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from eml_parser.notion_export import (
+    NOTION_REQUESTS_PER_SECOND,
+    NotionExporter,
+    connect_notion_target,
+    prepare_entry,
+)
+from eml_parser.parser import ParsedEmail
+from notion_standin import NotionStandIn, StandInSettings
+
+_KEY_POINTS = [
+    "The release moves to Thursday after the database migration.",
+    "Customers on the old plan keep their invoices until renewal.",
+    "Security patches go out with the next version.",
+]
+
+
+def make_emails(count: int, pdf_dir: Path | None) -> tuple[list[ParsedEmail], dict[Path, Path]]:
+    """Distinct synthetic emails, with a small fake PDF each if *pdf_dir* is set."""
+    start = datetime(2024, 1, 1, 9, 0)
+    emails = []
+    pdf_paths = {}
+    for i in range(count):
+        email = ParsedEmail(
+            filepath=Path(f"email_{i:05d}.eml"),
+            subject=f"Weekly update {i}",
+            sender="Ops Team <ops@example.com>",
+            recipients=["team@example.com"],
+            date=start + timedelta(hours=i),
+            plain_body="\n".join(_KEY_POINTS),
+            html_body="",
+            message_id=f"<update-{i}@example.com>",
+            content_hash=hashlib.sha256(f"email {i}".encode()).hexdigest(),
+        )
+        emails.append(email)
+        if pdf_dir:
+            pdf_path = pdf_dir / f"{email.logical_filename}.pdf"
+            pdf_path.write_bytes(b"%PDF-1.4\n" + bytes(20_000) + b"\n%%EOF\n")
+            pdf_paths[email.filepath] = pdf_path
+    return emails, pdf_paths
+
+
+def export_all(standin: NotionStandIn, emails, pdf_paths, workers: int, rate: float) -> tuple[float, list]:
+    """Export every email once; returns (seconds, ExportResults in order)."""
+    start = time.perf_counter()
+    target = connect_notion_target(
+        standin.database_id, "standin-token", attach_pdfs=bool(pdf_paths),
+        requests_per_second=rate, api_url=standin.url,
+    )
+    results = []
+    with NotionExporter(target, workers=workers) as exporter:
+        for email in emails:
+            entry = prepare_entry(email, _KEY_POINTS, pdf_path=pdf_paths.get(email.filepath))
+            results.extend(result for _, result in exporter.submit(entry))
+        results.extend(result for _, result in exporter.finish())
+    return time.perf_counter() - start, results
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--emails", type=int, default=30)
+    arg_parser.add_argument("--workers", default="1,2,4,8", help="Comma-separated worker counts")
+    arg_parser.add_argument("--rate", type=float, default=NOTION_REQUESTS_PER_SECOND,
+                            help="Client requests/second (--notion-rate)")
+    arg_parser.add_argument("--server-rate", type=float, default=3.0,
+                            help="Stand-in requests/second before 429s (0: none)")
+    arg_parser.add_argument("--latency", type=float, default=0.3, help="Seconds added to every response")
+    arg_parser.add_argument("--jitter", type=float, default=0.1, help="Extra random seconds per response")
+    arg_parser.add_argument("--throttle", type=float, default=0.0, help="Share of requests answered with 429")
+    arg_parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds sent with 429s")
+    arg_parser.add_argument("--pdfs", action="store_true", help="Attach a PDF to every page")
+    arg_parser.add_argument("--verbose", action="store_true", help="Show the exporter's log output")
+    args = arg_parser.parse_args()
+
+    try:
+        import notion_client  # noqa: F401
+    except ImportError:
+        sys.exit("notion-client is not installed; install it with: pip install 'notion-client>=2.7,<3'")
+    if not args.verbose:
+        logging.disable(logging.WARNING)
+
+    settings = StandInSettings(args.latency, args.jitter, args.throttle, args.server_rate, args.retry_after)
+    worker_counts = [int(n) for n in args.workers.split(",")]
+
+    with tempfile.TemporaryDirectory() as tmp, NotionStandIn(settings) as standin:
+        emails, pdf_paths = make_emails(args.emails, Path(tmp) if args.pdfs else None)
+        print(
+            f"{len(emails)} emails{' with PDFs' if args.pdfs else ''}; client {args.rate:g} req/s, "
+            f"server {args.server_rate:g} req/s, latency {args.latency:g}s +{args.jitter:g}s, "
+            f"{args.throttle:.0%} random 429s"
+        )
+        print(f"{'workers':>8} {'seconds':>9} {'exports/s':>10} {'requests':>9} {'429s':>6} {'failed':>7}")
+        baseline = None
+        for workers in worker_counts:
+            standin.reset()
+            seconds, results = export_all(standin, emails, pdf_paths, workers, args.rate)
+            stats = dict(standin.stats)
+            failed = sum(1 for result in results if result.error)
+
+            created = sorted(
+                page["properties"]["Message Hash"]["rich_text"][0]["plain_text"] for page in standin.pages
+            )
+            if not failed:
+                assert created == sorted(email.content_hash for email in emails), "pages differ from emails"
+            assert len(created) == len(set(created)), "an email was exported twice"
+
+            _, rerun = export_all(standin, emails, pdf_paths, workers, args.rate)
+            assert all(result.duplicate for result in rerun), "rerun did not skip existing pages"
+            assert len(standin.pages) == len(created), "rerun created pages"
+
+            baseline = baseline or seconds
+            print(
+                f"{workers:>8} {seconds:>9.2f} {len(emails) / seconds:>10.2f} "
+                f"{sum(stats.values()) - stats.get('throttled', 0):>9} {stats.get('throttled', 0):>6} {failed:>7}"
+                f"   {baseline / seconds:.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Benchmark per-email PDF rendering with fresh vs shared render resources.
+
+Usage: python benchmarks/bench_pdf_render.py [--count N]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from weasyprint import CSS, HTML
+from weasyprint.text.fonts import FontConfiguration
+
+from eml_parser.parser import ParsedEmail
+from eml_parser.pdf_converter import PAGE_CSS, email_to_pdf, get_render_resources
+
+
+def make_email(i: int) -> ParsedEmail:
+    body = "".join(f"<p>Paragraph {n} of message {i}. Lorem ipsum dolor sit amet.</p>" for n in range(20))
+    return ParsedEmail(
+        filepath=Path(f"bench_{i}.eml"),
+        subject=f"Benchmark message {i}",
+        sender="sender@example.com",
+        recipients=["recipient@example.com"],
+        date=datetime(2026, 1, 1),
+        plain_body="",
+        html_body=f"<html><body>{body}</body></html>",
+    )
+
+
+def bench_resource_setup(count: int) -> float:
+    """Seconds per FontConfiguration + CSS build (the pre-caching per-email cost)."""
+    start = time.perf_counter()
+    for _ in range(count):
+        font_config = FontConfiguration()
+        CSS(string=PAGE_CSS, font_config=font_config)
+    return (time.perf_counter() - start) / count
+
+
+def bench_render(count: int, shared: bool, output_dir: Path) -> float:
+    """Seconds per email_to_pdf call."""
+    emails = [make_email(i) for i in range(count)]
+    get_render_resources()  # warm up outside the timed region
+    start = time.perf_counter()
+    for i, email in enumerate(emails):
+        if not shared:
+            get_render_resources.cache_clear()
+        email_to_pdf(email, output_dir / f"{i}.pdf")
+    return (time.perf_counter() - start) / count
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--count", type=int, default=50)
+    args = arg_parser.parse_args()
+
+    HTML(string="<p></p>").render()  # first-render setup is not what we measure
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_dir = Path(tmp)
+        setup = bench_resource_setup(args.count)
+        fresh = bench_render(args.count, shared=False, output_dir=output_dir)
+        shared = bench_render(args.count, shared=True, output_dir=output_dir)
+
+    print(f"resource setup per email: {setup * 1000:8.2f} ms")
+    print(f"render, fresh resources:  {fresh * 1000:8.2f} ms/email")
+    print(f"render, shared resources: {shared * 1000:8.2f} ms/email")
+    print(f"saving:                   {(fresh - shared) * 1000:8.2f} ms/email")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Benchmark _protect_periods against the previous pattern-by-pattern version.
+
+Also checks that both produce identical output on a realistic body and on
+random strings built from digits, letters, "v" and periods.
+
+Usage: python benchmarks/bench_protect_periods.py [--size-kb N] [--repeat N] [--fuzz N]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from eml_parser.summarizer import _protect_periods
+
+LEGACY_PATTERNS = [
+    (r'v(\d+)\.(\d+)\.(\d+)', r'v\1_DOT_\2_DOT_\3'),
+    (r'(\d+)\.(\d+)\.(\d+)', r'\1_DOT_\2_DOT_\3'),
+    (r'(\d+)\.(\d+)', r'\1_DOT_\2'),
+    (r'([A-Za-z])\.([A-Za-z])\.', r'\1_DOT_\2_DOT_'),
+    (r'\.\.\.', '_ELLIPSIS_'),
+]
+
+# Characters for random strings: every kind of period context, plus a non-ASCII digit
+_FUZZ_ALPHABET = "v1.2.a.bZ9 ._\u0663x"
+
+
+def legacy_protect_periods(text: str) -> str:
+    """The five re.sub passes, for comparison."""
+    for pattern, replacement in LEGACY_PATTERNS:
+        text = re.sub(pattern, replacement, text)
+    return text
+
+
+def make_body(size_kb: float) -> str:
+    """Release-notes style prose with versions, decimals, initials and ellipses."""
+    chunk = (
+        "Hi team, the v2.14.3 rollout finished overnight and error rates fell 0.35 points. "
+        "Customers in the U.S. saw latency drop from 412.5 ms to 180.2 ms... mostly. "
+        "Next steps are listed below, e.g. migrating the 1.2.3.4 cluster. Thanks. "
+    )
+    return chunk * int(size_kb * 1024 / len(chunk))
+
+
+def fuzz(count: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    for _ in range(count):
+        text = "".join(rng.choice(_FUZZ_ALPHABET) for _ in range(rng.randint(0, 30)))
+        assert _protect_periods(text) == legacy_protect_periods(text), text
+
+
+def timed(func, text: str, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(text)
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--size-kb", type=float, default=256)
+    arg_parser.add_argument("--repeat", type=int, default=20)
+    arg_parser.add_argument("--fuzz", type=int, default=100_000)
+    args = arg_parser.parse_args()
+
+    body = make_body(args.size_kb)
+    assert _protect_periods(body) == legacy_protect_periods(body)
+    fuzz(args.fuzz)
+
+    legacy = timed(legacy_protect_periods, body, args.repeat)
+    current = timed(_protect_periods, body, args.repeat)
+    print(f"input size: {len(body) / 1024:.0f} K chars, {args.fuzz} random strings match")
+    print(f"legacy:     {legacy * 1000:8.2f} ms")
+    print(f"current:    {current * 1000:8.2f} ms")
+    print(f"speedup:    {legacy / current:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Benchmark sanitize_html_for_pdf against the previous multi-pass version.
+
+Usage: python benchmarks/bench_sanitize.py [--size-mb N] [--repeat N]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from eml_parser.pdf_converter import sanitize_html_for_pdf
+
+
+def legacy_sanitize_html_for_pdf(html_content: str) -> str:
+    """The regex + replace + per-character loop implementation, for comparison."""
+    html_content = re.sub(r'[\u200b-\u200f\u2028-\u202f\u2060-\u206f\ufeff]', '', html_content)
+    replacements = {
+        '\u2018': "'", '\u2019': "'", '\u201c': '"', '\u201d': '"',
+        '\u2014': '-', '\u2013': '-', '\u2026': '...', '\u00a0': ' ',
+    }
+    for char, replacement in replacements.items():
+        html_content = html_content.replace(char, replacement)
+    result = []
+    for char in html_content:
+        code = ord(char)
+        if code > 0xFFFF:
+            continue
+        if 0x2600 <= code <= 0x27BF:
+            continue
+        result.append(char)
+    return ''.join(result)
+
+
+def make_html(size_mb: float) -> str:
+    """Marketing-style HTML with smart quotes, nbsp, zero-width chars and emoji."""
+    chunk = (
+        '<td style="padding:0">\u201cBig sale\u201d \u2014 don\u2019t miss it\u2026'
+        '\u200b\u200c\u00a0<a href="https://example.com/click?id=abc">Shop \U0001F6CD</a> \u2605</td>\n'
+    )
+    return chunk * int(size_mb * 1024 * 1024 / len(chunk))
+
+
+def timed(func, text: str, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(text)
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--size-mb", type=float, default=2.0)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    html = make_html(args.size_mb)
+    assert sanitize_html_for_pdf(html) == legacy_sanitize_html_for_pdf(html)
+
+    legacy = timed(legacy_sanitize_html_for_pdf, html, args.repeat)
+    current = timed(sanitize_html_for_pdf, html, args.repeat)
+    print(f"input size: {len(html) / 1024 / 1024:.1f} M chars")
+    print(f"legacy:     {legacy * 1000:8.1f} ms")
+    print(f"current:    {current * 1000:8.1f} ms")
+    print(f"speedup:    {legacy / current:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Benchmark CLI startup: import cost of eml_parser.cli and an empty run.
+
+Runs `python -X importtime -c "import eml_parser.cli"` in a fresh process,
+reports the total and the slowest top-level imports, and checks that none
+of the heavy backends were loaded. Then times full `run.py` invocations on
+an empty input directory, the common case for a cron wrapper.
+
+Usage: python benchmarks/bench_startup.py [--repeat N] [--top N] [--log FILE]
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Backends that should only load when their stage runs
+HEAVY_MODULES = (
+    "weasyprint", "sumy", "nltk", "numpy", "bs4", "lxml",
+    "html2text", "jinja2", "notion_client", "pypandoc", "chardet",
+)
+
+# "import time: self [us] | cumulative | imported package"
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def import_times(log_path: Path | None) -> list[tuple[str, int, int]]:
+    """Return (module, cumulative_us, depth) for every import of eml_parser.cli.
+
+    Imports done by interpreter startup (up to and including site) are left
+    out; depth 0 is a module imported directly by the -c statement.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import eml_parser.cli"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    if log_path:
+        log_path.write_text(result.stderr, encoding="utf-8")
+
+    imports = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        module = match.group(4)
+        if module == "site":
+            imports.clear()
+            continue
+        imports.append((module, int(match.group(2)), len(match.group(3)) // 2))
+    return imports
+
+
+def empty_run_seconds(repeat: int) -> list[float]:
+    """Wall time of run.py on an empty input directory."""
+    timings = []
+    with tempfile.TemporaryDirectory() as tmp:
+        input_dir = Path(tmp) / "input"
+        input_dir.mkdir()
+        command = [
+            sys.executable, str(ROOT / "run.py"), str(input_dir),
+            "-o", str(Path(tmp) / "output"), "--no-summary-cache", "--no-manifest",
+        ]
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run(command, cwd=ROOT, capture_output=True, check=True)
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    arg_parser.add_argument("--top", type=int, default=10)
+    arg_parser.add_argument("--log", type=Path, default=None, help="Save the raw -X importtime output")
+    args = arg_parser.parse_args()
+
+    imports = import_times(args.log)
+    total = sum(cumulative for _, cumulative, depth in imports if depth == 0)
+    top_level = sorted(
+        ((module, cumulative) for module, cumulative, depth in imports if depth == 1),
+        key=lambda item: item[1], reverse=True,
+    )
+    loaded = {module.split(".")[0] for module, _, _ in imports}
+    heavy = [name for name in HEAVY_MODULES if name in loaded]
+
+    print(f"import eml_parser.cli: {total / 1000:8.1f} ms")
+    for module, cumulative in top_level[:args.top]:
+        print(f"  {module:<36} {cumulative / 1000:8.1f} ms")
+    print(f"heavy backends loaded: {', '.join(heavy) or 'none'}")
+
+    timings = empty_run_seconds(args.repeat)
+    print(f"run.py on empty dir:   {statistics.median(timings) * 1000:8.1f} ms (median of {args.repeat})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Compare summarization engines: throughput and overlap with LSA output.
+
+The corpus is a fixed set of synthetic emails, or the .eml files in
+--eml-dir. Overlap is the share of LSA's key points that each engine
+also picks, averaged over the corpus.
+
+Usage: python benchmarks/bench_summarizers.py [--emails 200] [--eml-dir DIR]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from eml_parser.summarizer import SUMMARIZERS, SummarizerEngine
+
+_VOCABULARY = (
+    "release deploy server database migration customer invoice report budget "
+    "quarter meeting schedule update security patch version network latency "
+    "storage backup incident review project deadline team feature request "
+    "approval contract vendor renewal training onboarding policy audit"
+).split()
+
+
+def make_corpus(email_count: int, seed: int = 0) -> list[str]:
+    """Generate email-like texts of 5 to 200 sentences."""
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(email_count):
+        topics = rng.sample(_VOCABULARY, 6)
+        sentences = []
+        for i in range(rng.choice((5, 10, 20, 50, 200))):
+            # Bias each email towards its own topics so the engines disagree
+            words = rng.choices(topics, k=rng.randint(2, 5)) + rng.choices(_VOCABULARY, k=rng.randint(4, 12))
+            rng.shuffle(words)
+            sentences.append(f"Note {i} on the {' '.join(words)}.")
+        texts.append(" ".join(sentences))
+    return texts
+
+
+def load_eml_corpus(directory: Path) -> list[str]:
+    """Summary text of every .eml file in a directory."""
+    from eml_parser.extractor import EmailArtifacts
+    from eml_parser.parser import parse_eml_file
+
+    return [EmailArtifacts(parse_eml_file(path)).summary_text for path in sorted(directory.glob("*.eml"))]
+
+
+def run(engine: SummarizerEngine, texts: list[str], sentences: int) -> tuple[float, list[list[str]]]:
+    start = time.perf_counter()
+    summaries = engine.summarize_many(texts, sentences)
+    return time.perf_counter() - start, summaries
+
+
+def overlap(reference: list[list[str]], summaries: list[list[str]]) -> float:
+    shares = [
+        len(set(ref) & set(summary)) / len(ref)
+        for ref, summary in zip(reference, summaries)
+        if ref
+    ]
+    return sum(shares) / len(shares) if shares else 0.0
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--emails", type=int, default=200)
+    arg_parser.add_argument("--sentences", type=int, default=3)
+    arg_parser.add_argument("--eml-dir", type=Path, default=None)
+    args = arg_parser.parse_args()
+
+    texts = load_eml_corpus(args.eml_dir) if args.eml_dir else make_corpus(args.emails)
+    engines = {"lsa (sumy)": SummarizerEngine()}
+    engines.update((name, cls()) for name, cls in SUMMARIZERS.items())
+
+    # Warm up tokenizers and stem caches outside the timed runs
+    for engine in engines.values():
+        engine.summarize_many(texts[:5], args.sentences)
+
+    results = {name: run(engine, texts, args.sentences) for name, engine in engines.items()}
+    _, reference = results["lsa"]
+    baseline = results["lsa (sumy)"][0]
+
+    print(f"{len(texts)} emails, {args.sentences} key points each")
+    print(f"{'engine':>12} {'seconds':>9} {'emails/s':>10} {'speedup':>8} {'lsa overlap':>12}")
+    for name, (seconds, summaries) in results.items():
+        print(
+            f"{name:>12} {seconds:>9.3f} {len(texts) / seconds:>10.1f} "
+            f"{baseline / seconds:>7.1f}x {overlap(reference, summaries):>11.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
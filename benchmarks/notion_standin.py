@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""Local HTTP stand-in for the parts of the Notion API the exporter uses.
+
+Serves databases.retrieve, data_sources.retrieve/query/update, pages.create
+and file_uploads.create/send under /v1/, keeping pages in memory. Every
+response can be delayed, a share of requests can be answered with 429, and
+a server-side token bucket rejects requests above a rate, like Notion does.
+
+Point the exporter at it with `--notion-api-url` (or NOTION_API_URL) and
+any token. Imported by bench_notion_export.py; run directly to serve:
+
+Usage: python benchmarks/notion_standin.py [--port N] [--latency S] [--jitter S]
+           [--throttle P] [--rate-limit R] [--retry-after S]
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Properties of the stand-in data source (the schema --notion-setup creates)
+SCHEMA = {
+    "Name": "title",
+    "Sender": "rich_text",
+    "Date": "date",
+    "Recipients": "rich_text",
+    "Key Points": "rich_text",
+    "Status": "select",
+    "PDF": "files",
+    "Message Hash": "rich_text",
+}
+
+_ROUTES = [
+    ("GET", re.compile(r"/v1/databases/([^/]+)"), "retrieve_database"),
+    ("GET", re.compile(r"/v1/data_sources/([^/]+)"), "retrieve_data_source"),
+    ("PATCH", re.compile(r"/v1/data_sources/([^/]+)"), "update_data_source"),
+    ("POST", re.compile(r"/v1/data_sources/([^/]+)/query"), "query_data_source"),
+    ("POST", re.compile(r"/v1/pages"), "create_page"),
+    ("POST", re.compile(r"/v1/file_uploads"), "create_file_upload"),
+    ("POST", re.compile(r"/v1/file_uploads/([^/]+)/send"), "send_file_upload"),
+]
+
+
+@dataclass
+class StandInSettings:
+    """Behaviour of the stand-in server.
+
+    *latency* plus up to *jitter* seconds is added to every response.
+    *throttle* is the share of requests answered with a random 429, and
+    *rate_limit* (requests per second, 0 for none) the rate above which
+    requests get a 429 with Retry-After: *retry_after*.
+    """
+    latency: float = 0.0
+    jitter: float = 0.0
+    throttle: float = 0.0
+    rate_limit: float = 0.0
+    retry_after: float = 1.0
+
+
+class _ApiError(Exception):
+    def __init__(self, status: int, code: str, message: str):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+
+
+def _with_plain_text(rich_text: list[dict]) -> list[dict]:
+    return [
+        {**part, "plain_text": part.get("text", {}).get("content", "")}
+        for part in rich_text
+    ]
+
+
+class NotionStandIn:
+    """In-memory Notion workspace with one database, served over HTTP.
+
+    Use as a context manager; requests are handled on background threads.
+    *stats* counts requests per endpoint plus "throttled" responses.
+    """
+
+    def __init__(self, settings: StandInSettings | None = None, *, host: str = "127.0.0.1", port: int = 0):
+        self.settings = settings or StandInSettings()
+        self.database_id = str(uuid.uuid4())
+        self.data_source_id = str(uuid.uuid4())
+        self.properties = {
+            name: {"id": name.lower().replace(" ", "_"), "name": name, "type": kind, kind: {}}
+            for name, kind in SCHEMA.items()
+        }
+        self._lock = threading.Lock()
+        self.reset()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def reset(self) -> None:
+        """Drop all pages and uploads and zero the statistics."""
+        with self._lock:
+            self.pages: list[dict] = []
+            self.uploads: dict[str, str] = {}
+            self.stats: dict[str, int] = {}
+            self._tokens = max(1.0, self.settings.rate_limit)
+            self._updated = time.monotonic()
+
+    def start(self) -> "NotionStandIn":
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] = self.stats.get(key, 0) + 1
+
+    def _admit(self) -> bool:
+        """Apply the server-side rate limit; False if the request is over it."""
+        rate = self.settings.rate_limit
+        if rate <= 0:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(max(1.0, rate), self._tokens + (now - self._updated) * rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    # --- endpoints ---
+
+    def retrieve_database(self, database_id: str, body: dict) -> dict:
+        if database_id != self.database_id:
+            raise _ApiError(404, "object_not_found", f"Could not find database with ID: {database_id}.")
+        return {
+            "object": "database",
+            "id": self.database_id,
+            "title": [{"type": "text", "text": {"content": "Stand-in"}, "plain_text": "Stand-in"}],
+            "data_sources": [{"id": self.data_source_id, "name": "Stand-in"}],
+        }
+
+    def _data_source(self, data_source_id: str) -> dict:
+        if data_source_id != self.data_source_id:
+            raise _ApiError(404, "object_not_found", f"Could not find data source with ID: {data_source_id}.")
+        return {"object": "data_source", "id": self.data_source_id, "properties": self.properties}
+
+    def retrieve_data_source(self, data_source_id: str, body: dict) -> dict:
+        return self._data_source(data_source_id)
+
+    def update_data_source(self, data_source_id: str, body: dict) -> dict:
+        self._data_source(data_source_id)
+        with self._lock:
+            for name, config in (body.get("properties") or {}).items():
+                kind = next(iter(config))
+                self.properties[name] = {"id": name.lower(), "name": name, "type": kind, kind: config[kind]}
+        return self._data_source(data_source_id)
+
+    def query_data_source(self, data_source_id: str, body: dict) -> dict:
+        self._data_source(data_source_id)
+        page_size = min(int(body.get("page_size") or 100), 100)
+        start = int(body.get("start_cursor") or 0)
+        with self._lock:
+            matches = [page for page in self.pages if _matches(page, body.get("filter"))]
+        results = matches[start:start + page_size]
+        more = start + page_size < len(matches)
+        return {
+            "object": "list",
+            "results": results,
+            "has_more": more,
+            "next_cursor": str(start + page_size) if more else None,
+        }
+
+    def create_page(self, _: None, body: dict) -> dict:
+        if (body.get("parent") or {}).get("database_id") != self.database_id:
+            raise _ApiError(404, "object_not_found", "Could not find the parent database.")
+        properties = {}
+        for name, value in (body.get("properties") or {}).items():
+            if name not in self.properties:
+                raise _ApiError(400, "validation_error", f"{name} is not a property that exists.")
+            kind = self.properties[name]["type"]
+            value = dict(value)
+            if kind in ("title", "rich_text"):
+                value[kind] = _with_plain_text(value.get(kind) or [])
+            if kind == "files":
+                for item in value.get("files") or []:
+                    upload_id = item.get("file_upload", {}).get("id")
+                    with self._lock:
+                        status = self.uploads.get(upload_id)
+                    if status != "uploaded":
+                        raise _ApiError(400, "validation_error", f"File upload {upload_id} is not uploaded.")
+            properties[name] = {"id": self.properties[name]["id"], "type": kind, **value}
+        page = {"object": "page", "id": str(uuid.uuid4()), "properties": properties}
+        with self._lock:
+            self.pages.append(page)
+        return page
+
+    def create_file_upload(self, _: None, body: dict) -> dict:
+        upload_id = str(uuid.uuid4())
+        with self._lock:
+            self.uploads[upload_id] = "pending"
+        return {"object": "file_upload", "id": upload_id, "status": "pending", "filename": body.get("filename")}
+
+    def send_file_upload(self, upload_id: str, body: dict) -> dict:
+        with self._lock:
+            if upload_id not in self.uploads:
+                raise _ApiError(404, "object_not_found", f"Could not find file upload with ID: {upload_id}.")
+            self.uploads[upload_id] = "uploaded"
+        return {"object": "file_upload", "id": upload_id, "status": "uploaded"}
+
+    def _handler_class(self):
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status: int, payload: dict, headers: dict | None = None) -> None:
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _error(self, status: int, code: str, message: str, headers: dict | None = None) -> None:
+                self._send(status, {"object": "error", "status": status, "code": code, "message": message}, headers)
+
+            def _dispatch(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                path = self.path.split("?", 1)[0]
+                for method, pattern, name in _ROUTES:
+                    match = pattern.fullmatch(path)
+                    if method == self.command and match:
+                        break
+                else:
+                    self._error(400, "invalid_request_url", f"Invalid request URL: {self.command} {path}")
+                    return
+
+                settings = standin.settings
+                delay = settings.latency + random.uniform(0, settings.jitter)
+                if delay:
+                    time.sleep(delay)
+                standin._count(name)
+                if not self.headers.get("Authorization"):
+                    self._error(401, "unauthorized", "API token is invalid.")
+                    return
+                if not standin._admit() or random.random() < settings.throttle:
+                    standin._count("throttled")
+                    self._error(
+                        429, "rate_limited", "You have been rate limited. Please try again in a few minutes.",
+                        {"Retry-After": f"{settings.retry_after:g}"},
+                    )
+                    return
+
+                # file_uploads.send is multipart; its body is accepted as is
+                body = {}
+                if raw and self.headers.get("Content-Type", "").startswith("application/json"):
+                    body = json.loads(raw)
+                try:
+                    result = getattr(standin, name)(match.group(1) if match.groups() else None, body)
+                except _ApiError as e:
+                    self._error(e.status, e.code, str(e))
+                    return
+                self._send(200, result)
+
+            do_GET = do_POST = do_PATCH = _dispatch
+
+        return Handler
+
+
+def _matches(page: dict, condition: dict | None) -> bool:
+    """Evaluate the subset of query filters the exporter sends."""
+    if not condition:
+        return True
+    if "and" in condition:
+        return all(_matches(page, part) for part in condition["and"])
+    if "or" in condition:
+        return any(_matches(page, part) for part in condition["or"])
+    value = page["properties"].get(condition.get("property"), {})
+    if "title" in condition or "rich_text" in condition:
+        kind = "title" if "title" in condition else "rich_text"
+        text = "".join(part.get("plain_text", "") for part in value.get(kind) or [])
+        return text == condition[kind].get("equals")
+    if "date" in condition:
+        start = (value.get("date") or {}).get("start") or ""
+        return start[:10] == condition["date"].get("equals")
+    return False
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--host", default="127.0.0.1")
+    arg_parser.add_argument("--port", type=int, default=8765)
+    arg_parser.add_argument("--latency", type=float, default=0.2, help="Seconds added to every response")
+    arg_parser.add_argument("--jitter", type=float, default=0.1, help="Extra random seconds per response")
+    arg_parser.add_argument("--throttle", type=float, default=0.0, help="Share of requests answered with 429")
+    arg_parser.add_argument("--rate-limit", type=float, default=3.0, help="Requests/second before 429s (0: none)")
+    arg_parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds sent with 429s")
+    args = arg_parser.parse_args()
+
+    settings = StandInSettings(args.latency, args.jitter, args.throttle, args.rate_limit, args.retry_after)
+    with NotionStandIn(settings, host=args.host, port=args.port) as standin:
+        print(f"Serving a Notion stand-in on {standin.url}")
+        print(f"  NOTION_API_URL={standin.url} NOTION_TOKEN=test NOTION_DATABASE_ID={standin.database_id}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            print(f"\nRequests: {standin.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
 """Command-line interface for EML Parser."""
 
-import shutil
+import signal
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import ExitStack
+from itertools import batched
 from pathlib import Path
 
 import click
@@ -8,12 +11,26 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-from .parser import scan_directory
-from .pdf_converter import convert_emails_to_pdf
+from .corpus_stats import CorpusStats
+from .manifest import Manifest
+from .parser import parse_eml_files, scan_directory
+from .pdf_converter import create_pdf_pool
+from .pipeline import EmailPipeline, move_processed_files
 from .report import generate_report
-from .rtf_converter import convert_emails_to_rtf
-from .notion_export import export_emails_to_notion, setup_notion_database
-from .utils import configure_logging, deduplicate_path
+from .summarizer import DEFAULT_SUMMARIZER, SUMMARIZERS, KeyPointStore
+from .summary_cache import SummaryCache
+from .rtf_converter import PANDOC_BATCH_SIZE, RTF_BACKENDS
+from .notion_export import (
+    NOTION_REQUESTS_PER_SECOND,
+    NOTION_WORKERS,
+    NotionExporter,
+    connect_notion_target,
+    drain_outbox,
+    setup_notion_database,
+)
+from .notion_outbox import NotionOutbox
+from .utils import configure_logging
+from .watcher import DirectoryWatcher
 
 
 # Base directory is the parent of the eml_parser package (project root)
@@ -21,6 +38,20 @@ BASE_DIR = Path(__file__).parent.parent.resolve()
 DEFAULT_INPUT_DIR = BASE_DIR / "input"
 DEFAULT_OUTPUT_DIR = BASE_DIR / "output"
 DEFAULT_PROCESSED_DIR = BASE_DIR / "processed"
+DEFAULT_SUMMARY_CACHE = BASE_DIR / "cache" / "summaries.sqlite"
+DEFAULT_CORPUS_STATS = BASE_DIR / "cache" / "corpus.sqlite"
+DEFAULT_MANIFEST = BASE_DIR / "cache" / "manifest.sqlite"
+DEFAULT_NOTION_OUTBOX = BASE_DIR / "cache" / "notion_outbox.sqlite"
+
+# Emails held per PDF worker when rendering in parallel
+PDF_BATCH_PER_WORKER = 4
+
+# Minimum batch size with --corpus-stats, so boilerplate shared within a
+# batch is counted before any email in it is summarized
+CORPUS_STATS_BATCH_SIZE = 200
+
+# Emails shown in the report while watching (the most recent ones)
+WATCH_REPORT_ENTRIES = 1000
 
 
 @click.command()
@@ -37,11 +68,71 @@ DEFAULT_PROCESSED_DIR = BASE_DIR / "processed"
     default=3,
     help="Number of key sentences to extract per email"
 )
+@click.option(
+    "-j", "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of worker processes for parsing and PDF rendering"
+)
+@click.option(
+    "--summarizer",
+    type=click.Choice(tuple(SUMMARIZERS)),
+    default=DEFAULT_SUMMARIZER,
+    show_default=True,
+    help="Key-point algorithm: lsa (best quality), textrank, or lead (fastest, for bulk backfills)"
+)
+@click.option(
+    "--summary-cache",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=DEFAULT_SUMMARY_CACHE,
+    help="SQLite file caching key points across runs. Defaults to <project>/cache/summaries.sqlite"
+)
+@click.option(
+    "--no-summary-cache",
+    is_flag=True,
+    help="Always summarize from scratch without reading or writing the cache"
+)
+@click.option(
+    "--corpus-stats",
+    is_flag=True,
+    help="Drop lines repeated across many emails (footers, legal text) before summarizing"
+)
+@click.option(
+    "--corpus-stats-db",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=DEFAULT_CORPUS_STATS,
+    help="SQLite file keeping line counts for --corpus-stats across runs, or :memory: "
+         "for this run only. Defaults to <project>/cache/corpus.sqlite"
+)
+@click.option(
+    "--manifest",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=DEFAULT_MANIFEST,
+    help="SQLite file recording which stages each email has finished, so reruns skip "
+         "finished work. Defaults to <project>/cache/manifest.sqlite"
+)
+@click.option(
+    "--no-manifest",
+    is_flag=True,
+    help="Redo every stage for every email without reading or writing the manifest"
+)
 @click.option(
     "--skip-pdf",
     is_flag=True,
     help="Skip PDF generation (summary report and RTFs still created)"
 )
+@click.option(
+    "--rtf-backend",
+    type=click.Choice(RTF_BACKENDS),
+    default="native",
+    show_default=True,
+    help="RTF writer: built-in (fast) or pandoc (higher fidelity)"
+)
+@click.option(
+    "--watch",
+    is_flag=True,
+    help="Keep running and process .eml files as they arrive in INPUT_DIR"
+)
 @click.option(
     "-v", "--verbose",
     is_flag=True,
@@ -69,6 +160,38 @@ DEFAULT_PROCESSED_DIR = BASE_DIR / "processed"
     is_flag=True,
     help="Skip duplicate detection when exporting to Notion"
 )
+@click.option(
+    "--notion-workers",
+    type=click.IntRange(min=1),
+    default=NOTION_WORKERS,
+    show_default=True,
+    help="Emails exported to Notion at once"
+)
+@click.option(
+    "--notion-rate",
+    type=click.FloatRange(min=0, min_open=True),
+    default=NOTION_REQUESTS_PER_SECOND,
+    show_default=True,
+    help="Maximum Notion API requests per second"
+)
+@click.option(
+    "--notion-api-url",
+    envvar="NOTION_API_URL",
+    default=None,
+    help="Base URL of the Notion API, e.g. a local stand-in (or set NOTION_API_URL env var)"
+)
+@click.option(
+    "--notion-outbox",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=DEFAULT_NOTION_OUTBOX,
+    help="SQLite file queuing Notion pages until they are sent. "
+         "Defaults to <project>/cache/notion_outbox.sqlite"
+)
+@click.option(
+    "--notion-drain",
+    is_flag=True,
+    help="Send the Notion pages still queued in the outbox, then exit"
+)
 @click.option(
     "--notion-setup",
     default=None,
@@ -79,12 +202,27 @@ def main(
     input_dir: Path,
     output_dir: Path | None,
     sentences: int,
+    jobs: int,
+    summarizer: str,
+    summary_cache: Path,
+    no_summary_cache: bool,
+    corpus_stats: bool,
+    corpus_stats_db: Path,
+    manifest: Path,
+    no_manifest: bool,
     skip_pdf: bool,
+    rtf_backend: str,
+    watch: bool,
     verbose: bool,
     notion: bool,
     notion_token: str | None,
     notion_database_id: str | None,
     notion_no_dedup: bool,
+    notion_workers: int,
+    notion_rate: float,
+    notion_api_url: str | None,
+    notion_outbox: Path,
+    notion_drain: bool,
     notion_setup: str | None,
 ):
     """
@@ -107,81 +245,222 @@ def main(
         click.echo(f"  NOTION_TOKEN=<token> NOTION_DATABASE_ID={db_id} python run.py --notion")
         return
 
-    if notion and not notion_token:
+    if (notion or notion_drain) and not notion_token:
         raise click.ClickException(
             "Notion token is required. Set NOTION_TOKEN or use --notion-token."
         )
-    if notion and not notion_database_id:
+    if (notion or notion_drain) and not notion_database_id:
         raise click.ClickException(
             "Notion database ID is required. Set NOTION_DATABASE_ID or use --notion-database-id."
         )
 
+    if notion_drain:
+        _drain_notion_outbox(
+            notion_outbox, notion_database_id, notion_token,
+            workers=notion_workers, rate=notion_rate, skip_duplicates=not notion_no_dedup,
+            api_url=notion_api_url,
+        )
+        return
+
     if output_dir is None:
         output_dir = DEFAULT_OUTPUT_DIR
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    click.echo(f"Scanning {input_dir} for .eml files...")
-    emails = list(scan_directory(input_dir))
-
-    if not emails:
-        click.echo("No .eml files found in the specified directory.")
-        return
-
-    click.echo(f"Found {len(emails)} email(s)")
-
-    pdf_paths = {}
-
-    if not skip_pdf:
-        click.echo("\nConverting emails to PDF...")
-        pdf_dir = output_dir / "pdfs"
-        results = convert_emails_to_pdf(emails, pdf_dir)
-        pdf_paths = {email.filepath: pdf_path for email, pdf_path in results}
-
-    # Convert to RTF (always runs, even with --skip-pdf)
-    click.echo("\nConverting emails to RTF...")
-    rtf_results = convert_emails_to_rtf(emails, output_dir)
-    click.echo(f"  Converted {len(rtf_results)}/{len(emails)} emails to RTF")
-
-    # Export to Notion (optional)
+    notion_target = None
     if notion:
-        click.echo("\nExporting to Notion...")
         try:
-            notion_results = export_emails_to_notion(
-                emails,
-                notion_database_id,
-                notion_token,
-                sentences,
-                skip_duplicates=not notion_no_dedup,
-                pdf_paths=pdf_paths or None,
+            notion_target = connect_notion_target(
+                notion_database_id, notion_token, attach_pdfs=not skip_pdf,
+                requests_per_second=notion_rate, api_url=notion_api_url,
             )
-            click.echo(f"  Exported {len(notion_results)}/{len(emails)} emails to Notion")
         except click.ClickException:
             raise
         except Exception as e:
-            click.echo(f"  Notion export failed: {e}", err=True)
+            click.echo(
+                f"Notion is unreachable ({e}); pages will be queued for --notion-drain", err=True,
+            )
+
+    pdf_dir = output_dir / "pdfs"
+    if not skip_pdf:
+        pdf_dir.mkdir(parents=True, exist_ok=True)
+
+    batch_size = jobs * PDF_BATCH_PER_WORKER if jobs > 1 else 1
+    if rtf_backend == "pandoc":
+        # Larger batches let one pandoc process convert many emails
+        batch_size = max(batch_size, PANDOC_BATCH_SIZE)
+    if corpus_stats:
+        batch_size = max(batch_size, CORPUS_STATS_BATCH_SIZE)
 
-    click.echo("\nGenerating summary report...")
     report_path = output_dir / "email_summary.html"
-    generate_report(emails, pdf_paths, report_path, sentences)
+
+    with ExitStack() as stack:
+        cache = None
+        if not no_summary_cache:
+            cache = stack.enter_context(SummaryCache(summary_cache))
+        stats = None
+        if corpus_stats:
+            stats = stack.enter_context(CorpusStats(corpus_stats_db))
+        stage_manifest = None
+        if not no_manifest:
+            stage_manifest = stack.enter_context(Manifest(manifest))
+
+        pdf_pool = None
+        if not skip_pdf and jobs > 1:
+            pdf_pool = stack.enter_context(create_pdf_pool(jobs))
+
+        outbox = None
+        if notion:
+            outbox = stack.enter_context(NotionOutbox(notion_outbox))
+        notion_exporter = None
+        if notion_target:
+            notion_exporter = stack.enter_context(NotionExporter(
+                notion_target, workers=notion_workers, skip_duplicates=not notion_no_dedup,
+            ))
+
+        pipeline = EmailPipeline(
+            output_dir=output_dir,
+            key_point_store=KeyPointStore(cache, summarizer, stats),
+            sentences=sentences,
+            rtf_backend=rtf_backend,
+            pdf_dir=None if skip_pdf else pdf_dir,
+            pdf_pool=pdf_pool,
+            corpus_stats=stats,
+            notion_outbox=outbox,
+            notion_exporter=notion_exporter,
+            manifest=stage_manifest,
+        )
+
+        if watch:
+            watcher = stack.enter_context(DirectoryWatcher(input_dir))
+            # Parse in the PDF pool, or in one pool kept for the whole watch
+            parse_pool = pdf_pool
+            if parse_pool is None and jobs > 1:
+                parse_pool = stack.enter_context(ProcessPoolExecutor(max_workers=jobs))
+            _watch(pipeline, watcher, jobs, batch_size, report_path, parse_pool)
+            return
+
+        click.echo(f"Processing .eml files in {input_dir}...")
+        for batch in batched(scan_directory(input_dir, workers=jobs), batch_size):
+            pipeline.process(batch)
+        pipeline.finish()
+        queued = outbox.pending_count() if outbox is not None else 0
+
+    if not pipeline.processed_files:
+        click.echo("No .eml files found in the specified directory.")
+        return
+
+    total = len(pipeline.processed_files)
+    click.echo(f"Processed {total} email(s)")
+    if pipeline.resumed_count:
+        click.echo(f"  Reused earlier output for {pipeline.resumed_count}/{total} emails")
+    if not skip_pdf:
+        click.echo(f"  Converted {pipeline.pdf_count}/{total} emails to PDF")
+    click.echo(f"  Converted {pipeline.rtf_count}/{total} emails to RTF")
+    if notion_target:
+        click.echo(f"  Exported {pipeline.notion_count}/{total} emails to Notion")
+    if queued:
+        click.echo(f"  {queued} Notion page(s) queued; send them with --notion-drain")
+
+    click.echo("\nGenerating summary report...")
+    generate_report(pipeline.report_entries, report_path)
 
     click.echo(f"\nDone! Output saved to: {output_dir}")
     click.echo(f"  - Summary report: {report_path}")
     click.echo(f"  - RTFs: {output_dir}")
     if not skip_pdf:
-        click.echo(f"  - PDFs: {output_dir / 'pdfs'}")
+        click.echo(f"  - PDFs: {pdf_dir}")
 
     # Move processed .eml files to processed directory
-    processed_dir = DEFAULT_PROCESSED_DIR
-    processed_dir.mkdir(parents=True, exist_ok=True)
-
-    click.echo(f"\nMoving processed files to: {processed_dir}")
-    for email in emails:
-        src = email.filepath
-        dst = deduplicate_path(processed_dir / src.name)
-        shutil.move(str(src), str(dst))
+    click.echo(f"\nMoving processed files to: {DEFAULT_PROCESSED_DIR}")
+    for src, dst in move_processed_files(pipeline.processed_files, DEFAULT_PROCESSED_DIR):
         click.echo(f"  Moved: {src.name} -> {dst.name}")
 
 
+def _drain_notion_outbox(
+    outbox_path: Path,
+    database_id: str,
+    token: str,
+    *,
+    workers: int,
+    rate: float,
+    skip_duplicates: bool,
+    api_url: str | None,
+) -> None:
+    """Send every page waiting in the Notion outbox."""
+    try:
+        target = connect_notion_target(
+            database_id, token, attach_pdfs=True, requests_per_second=rate, api_url=api_url,
+        )
+    except click.ClickException:
+        raise
+    except Exception as e:
+        raise click.ClickException(f"Notion is unreachable ({e}); queued pages stay in the outbox")
+    with NotionOutbox(outbox_path) as outbox:
+        pending = outbox.pending_count()
+        if not pending:
+            click.echo("Notion outbox is empty.")
+            return
+        click.echo(f"Sending {pending} queued page(s) to Notion...")
+        with NotionExporter(target, workers=workers, skip_duplicates=skip_duplicates) as exporter:
+            sent, duplicates, failed = drain_outbox(outbox, exporter)
+
+    click.echo(f"  Created {sent} page(s)")
+    if duplicates:
+        click.echo(f"  Skipped {duplicates} duplicate(s)")
+    if failed:
+        click.echo(f"  {failed} page(s) failed and stay queued; run --notion-drain again to retry")
+
+
+def _stop_on_sigterm(signum, frame):
+    raise KeyboardInterrupt
+
+
+def _watch(
+    pipeline: EmailPipeline,
+    watcher: DirectoryWatcher,
+    jobs: int,
+    batch_size: int,
+    report_path: Path,
+    parse_pool: Executor | None = None,
+) -> None:
+    """Process .eml files as they arrive until interrupted.
+
+    Workers (including *parse_pool*, which parses arriving files when
+    jobs > 1), caches and the summarizer stay loaded between files. After
+    each round the report is rewritten with the most recent emails and the
+    sources are moved to the processed directory.
+    """
+    pipeline.warm_up(jobs)
+    signal.signal(signal.SIGTERM, _stop_on_sigterm)
+    mode = "inotify" if watcher.uses_inotify else "polling"
+    click.echo(f"Watching {watcher.directory} for .eml files ({mode}); press Ctrl+C to stop")
+
+    cache = pipeline.key_point_store.cache
+    try:
+        for paths in watcher:
+            emails = parse_eml_files(paths, jobs, executor=parse_pool)
+            for batch in batched(emails, batch_size):
+                pipeline.process(batch)
+            pipeline.finish()
+            if not pipeline.processed_files:
+                continue
+
+            # Keep the daemon's memory flat: only recent report entries are kept
+            del pipeline.report_entries[:-WATCH_REPORT_ENTRIES]
+            pipeline.key_point_store.clear()
+            generate_report(pipeline.report_entries, report_path)
+            if cache is not None:
+                cache.flush()
+            if pipeline.corpus_stats is not None:
+                pipeline.corpus_stats.flush()
+
+            for src, dst in move_processed_files(pipeline.processed_files, DEFAULT_PROCESSED_DIR):
+                click.echo(f"Processed: {src.name} -> {dst}")
+            pipeline.processed_files.clear()
+    except KeyboardInterrupt:
+        click.echo("\nStopped watching.")
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,144 @@
+"""Corpus-wide line frequencies, used to drop boilerplate before summarizing."""
+
+import hashlib
+import re
+import sqlite3
+from pathlib import Path
+
+from .utils import get_logger
+
+logger = get_logger(__name__)
+
+# A line is boilerplate once it has been seen in at least DEFAULT_MIN_EMAILS
+# emails and in at least DEFAULT_MIN_SHARE of all emails counted
+DEFAULT_MIN_EMAILS = 5
+DEFAULT_MIN_SHARE = 0.01
+
+# Writes between commits
+_COMMIT_INTERVAL = 100
+
+_DIGITS = re.compile(r"\d+")
+_WHITESPACE = re.compile(r"\s+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS lines (
+    fingerprint INTEGER PRIMARY KEY,
+    emails INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS emails (
+    digest TEXT PRIMARY KEY
+);
+"""
+
+
+def line_fingerprint(line: str) -> int:
+    """64-bit hash of a line, ignoring case, numbers and spacing.
+
+    Footers that differ only in dates, years or counts hash the same.
+    """
+    normalized = _WHITESPACE.sub(" ", _DIGITS.sub("0", line.lower())).strip()
+    digest = hashlib.blake2b(normalized.encode("utf-8", errors="surrogatepass"), digest_size=8)
+    return int.from_bytes(digest.digest(), "big", signed=True)
+
+
+class CorpusStats:
+    """How many emails each summary-text line appears in, across the corpus.
+
+    Summary text has one paragraph per line, so footers, legal notices and
+    "view in browser" banners show up as the same line in many emails.
+    Those lines are removed by strip_boilerplate before summarization, which
+    both keeps them out of the key points and shrinks the LSA matrix.
+
+    Counts live in SQLite at *path*, so they build up across runs; pass
+    ":memory:" to count within one run only. Each email text is counted
+    once, however often it is observed.
+    """
+
+    def __init__(
+        self,
+        path: Path | str = ":memory:",
+        *,
+        min_emails: int = DEFAULT_MIN_EMAILS,
+        min_share: float = DEFAULT_MIN_SHARE,
+    ):
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.min_emails = min_emails
+        self.min_share = min_share
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        (self.total_emails,) = self._conn.execute("SELECT COUNT(*) FROM emails").fetchone()
+        self._pending_writes = 0
+
+    def observe(self, text: str) -> None:
+        """Count the distinct lines of one email's summary text."""
+        digest = hashlib.sha256(text.encode("utf-8", errors="surrogatepass")).hexdigest()
+        inserted = self._conn.execute(
+            "INSERT OR IGNORE INTO emails (digest) VALUES (?)", (digest,)
+        ).rowcount
+        if not inserted:
+            return
+
+        fingerprints = {line_fingerprint(line) for line in text.splitlines() if line.strip()}
+        self._conn.executemany(
+            "INSERT INTO lines (fingerprint, emails) VALUES (?, 1) "
+            "ON CONFLICT (fingerprint) DO UPDATE SET emails = emails + 1",
+            ((fingerprint,) for fingerprint in fingerprints),
+        )
+        self.total_emails += 1
+        self._pending_writes += 1
+        if self._pending_writes >= _COMMIT_INTERVAL:
+            self.flush()
+
+    def _threshold(self) -> int:
+        return max(self.min_emails, int(self.total_emails * self.min_share))
+
+    def _line_counts(self, fingerprints: list[int]) -> dict[int, int]:
+        counts = {}
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(fingerprints), 500):
+            chunk = fingerprints[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            counts.update(self._conn.execute(
+                f"SELECT fingerprint, emails FROM lines WHERE fingerprint IN ({placeholders})",
+                chunk,
+            ))
+        return counts
+
+    def strip_boilerplate(self, text: str) -> str:
+        """Remove lines seen in too many emails.
+
+        The text is returned unchanged if every line is boilerplate, so an
+        email that only repeats a standard notice still gets key points.
+        """
+        lines = text.splitlines()
+        fingerprints = [line_fingerprint(line) for line in lines]
+        counts = self._line_counts(list(set(fingerprints)))
+        threshold = self._threshold()
+
+        kept = [
+            line for line, fingerprint in zip(lines, fingerprints)
+            if counts.get(fingerprint, 0) < threshold
+        ]
+        if len(kept) == len(lines) or not any(line.strip() for line in kept):
+            return text
+        logger.debug("Dropped %d boilerplate line(s)", len(lines) - len(kept))
+        return "\n".join(kept)
+
+    def flush(self) -> None:
+        """Commit pending counts."""
+        self._conn.commit()
+        self._pending_writes = 0
+
+    def close(self) -> None:
+        """Flush and close the database."""
+        self.flush()
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
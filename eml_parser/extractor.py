@@ -2,11 +2,14 @@
 
 import html
 import re
-
-import html2text
-from bs4 import BeautifulSoup
+from typing import TYPE_CHECKING
 
 from .parser import ParsedEmail
+from .summarizer import SENTENCES_COUNT, KeyPointStore
+
+# BeautifulSoup and html2text are imported on first use
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
 
 # Invisible/whitespace Unicode characters to strip
 INVISIBLE_CHARS = re.compile(r'[\u200c\u200b\u200d\u2060\ufeff\u00ad]+')
@@ -40,10 +43,22 @@ def get_text_content(email: ParsedEmail) -> str:
 
 def html_to_text_for_summary(html_content: str) -> str:
     """Convert HTML to plain text optimized for summarization (strips tracking noise)."""
+    from bs4 import BeautifulSoup
+
     soup = BeautifulSoup(html_content, "lxml")
 
-    # Remove tracking pixels, scripts, styles, and hidden elements
-    for tag in soup(["script", "style", "img", "noscript"]):
+    for tag in soup(["script", "style"]):
+        tag.decompose()
+
+    return _summary_text_from_soup(soup)
+
+
+def _summary_text_from_soup(soup: "BeautifulSoup") -> str:
+    """Extract summary text from a soup whose scripts and styles are removed."""
+    import html2text
+
+    # Remove tracking pixels and hidden elements
+    for tag in soup(["img", "noscript"]):
         tag.decompose()
 
     # Remove elements with tracking-related classes/ids
@@ -102,16 +117,30 @@ def clean_text_for_summary(text: str) -> str:
 def get_html_for_pdf(email: ParsedEmail) -> str:
     """Get HTML content suitable for PDF rendering."""
     if email.html_body:
+        from bs4 import BeautifulSoup
+
         soup = BeautifulSoup(email.html_body, "lxml")
 
         # Remove script and style tags
         for tag in soup(["script", "style"]):
             tag.decompose()
 
-        # Add basic styling if not present
-        if not soup.find("style"):
-            style = soup.new_tag("style")
-            style.string = """
+        return _render_html_from_soup(soup)
+
+    return _plain_text_to_html(email)
+
+
+def _render_html_from_soup(soup: "BeautifulSoup") -> str:
+    """Serialize a soup (scripts and styles removed) with basic page styling.
+
+    The added style tag is removed again before returning, so the soup can
+    be reused for summary text extraction.
+    """
+    # Add basic styling if not present
+    style = None
+    if not soup.find("style"):
+        style = soup.new_tag("style")
+        style.string = """
                 body {
                     font-family: Arial, sans-serif;
                     font-size: 12pt;
@@ -122,15 +151,21 @@ def get_html_for_pdf(email: ParsedEmail) -> str:
                 }
                 img { max-width: 100%; height: auto; }
             """
-            if soup.head:
-                soup.head.append(style)
-            elif soup.html:
-                head = soup.new_tag("head")
-                head.append(style)
-                soup.html.insert(0, head)
+        if soup.head:
+            soup.head.append(style)
+        elif soup.html:
+            head = soup.new_tag("head")
+            head.append(style)
+            soup.html.insert(0, head)
+
+    render_html = str(soup)
+    if style is not None:
+        style.decompose()
+    return render_html
 
-        return str(soup)
 
+def _plain_text_to_html(email: ParsedEmail) -> str:
+    """Wrap a plain-text body in simple HTML, or a placeholder if empty."""
     # Convert plain text to simple HTML
     if email.plain_body:
         escaped = html.escape(email.plain_body)
@@ -158,3 +193,57 @@ def get_html_for_pdf(email: ParsedEmail) -> str:
 </html>"""
 
     return "<html><body><p>No content available</p></body></html>"
+
+
+class EmailArtifacts:
+    """Content derived from one email, computed at most once and shared.
+
+    The PDF and RTF converters need the render HTML, while the report and
+    Notion export need the summary text and key points. For HTML emails
+    both come from a single BeautifulSoup parse. Key points are read from
+    *key_point_store* when one is shared across the run.
+    """
+
+    def __init__(self, email: ParsedEmail, key_point_store: KeyPointStore | None = None):
+        self.email = email
+        # An empty store is falsy (it has __len__), so test for None
+        self.key_point_store = key_point_store if key_point_store is not None else KeyPointStore()
+        self._render_html: str | None = None
+        self._summary_text: str | None = None
+
+    def _derive_from_html(self) -> None:
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(self.email.html_body, "lxml")
+        for tag in soup(["script", "style"]):
+            tag.decompose()
+
+        # Serialize before summary extraction strips images and links
+        self._render_html = _render_html_from_soup(soup)
+        self._summary_text = _summary_text_from_soup(soup)
+
+    @property
+    def render_html(self) -> str:
+        """HTML for PDF/RTF rendering (same as get_html_for_pdf)."""
+        if self._render_html is None:
+            if self.email.html_body:
+                self._derive_from_html()
+            else:
+                self._render_html = _plain_text_to_html(self.email)
+        return self._render_html
+
+    @property
+    def summary_text(self) -> str:
+        """Clean text for summarization (same as get_text_content)."""
+        if self._summary_text is None:
+            if self.email.html_body:
+                self._derive_from_html()
+            else:
+                self._summary_text = get_text_content(self.email)
+        return self._summary_text
+
+    def key_points(self, sentence_count: int = SENTENCES_COUNT) -> list[str]:
+        """Key sentences from the summary text."""
+        return self.key_point_store.get(
+            self.email.filepath, sentence_count, lambda: self.summary_text,
+        )
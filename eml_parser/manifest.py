@@ -0,0 +1,90 @@
+"""Record which output stages each email has finished, across runs."""
+
+import sqlite3
+import time
+from pathlib import Path
+
+from .parser import ParsedEmail
+from .utils import get_logger
+
+logger = get_logger(__name__)
+
+# Output stages tracked per email
+STAGE_PDF = "pdf"
+STAGE_RTF = "rtf"
+STAGE_NOTION = "notion"
+STAGE_REPORT = "report"
+STAGES = (STAGE_PDF, STAGE_RTF, STAGE_NOTION, STAGE_REPORT)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS emails (
+    content_hash TEXT PRIMARY KEY,
+    message_id TEXT NOT NULL,
+    source_name TEXT NOT NULL,
+    first_seen REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS stages (
+    content_hash TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    result TEXT NOT NULL,
+    completed REAL NOT NULL,
+    PRIMARY KEY (content_hash, stage)
+);
+"""
+
+
+class Manifest:
+    """SQLite record of finished output stages, keyed by email content.
+
+    An email is identified by the SHA-256 of its raw bytes only, so a
+    reused or edited Message-ID never brings in another email's output;
+    the Message-ID and file name are kept for inspection. Each stage
+    stores its result: the output path for PDF and RTF, the page ID for
+    Notion, and for the report the key points with the summarizer
+    settings that made them (JSON), so a rerun with the same settings can
+    rebuild the report without summarizing.
+
+    Writes are committed by flush(), which the pipeline calls after every
+    batch; a crash loses at most the batch in progress.
+    """
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def completed(self, email: ParsedEmail) -> dict[str, str]:
+        """Return {stage: result} for every stage the email has finished."""
+        return dict(self._conn.execute(
+            "SELECT stage, result FROM stages WHERE content_hash = ?", (email.content_hash,)
+        ))
+
+    def record(self, email: ParsedEmail, stage: str, result: str) -> None:
+        """Mark *stage* as finished for an email."""
+        self._conn.execute(
+            "INSERT OR IGNORE INTO emails (content_hash, message_id, source_name, first_seen) "
+            "VALUES (?, ?, ?, ?)",
+            (email.content_hash, email.message_id, email.filepath.name, time.time()),
+        )
+        self._conn.execute(
+            "INSERT OR REPLACE INTO stages (content_hash, stage, result, completed) "
+            "VALUES (?, ?, ?, ?)",
+            (email.content_hash, stage, result, time.time()),
+        )
+
+    def flush(self) -> None:
+        """Commit recorded stages."""
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Flush and close the database."""
+        self.flush()
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
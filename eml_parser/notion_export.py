@@ -1,22 +1,46 @@
 """Export emails to a Notion database."""
 
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 import click
 
-from .extractor import get_text_content
+from .extractor import EmailArtifacts
+from .notion_outbox import ExportResult, NotionOutbox, OutboxEntry
 from .parser import ParsedEmail
-from .summarizer import extract_key_points
+from .summarizer import KeyPointStore
+from .throttle import (
+    MAX_ATTEMPTS,
+    RateLimiter,
+    RetryAdvice,
+    ThrottledClient,
+    backoff_delay,
+    parse_retry_after,
+)
 from .utils import get_logger
 
 logger = get_logger(__name__)
 
-try:
-    from notion_client import Client
-    from notion_client.errors import APIResponseError
-except ImportError:
-    Client = None
-    APIResponseError = None
+# Notion allows an average of three requests per second per integration
+NOTION_REQUESTS_PER_SECOND = 3.0
+
+# HTTP statuses worth retrying: rate limited, or a temporary server problem
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Calls that create something, so repeating one that may have gone through
+# makes a second copy; only retried when the request surely had no effect
+_NOT_IDEMPOTENT = ("pages.create", "file_uploads.create")
+
+# Threads exporting at once; enough to keep the rate limit busy while
+# each request waits on its round trip
+NOTION_WORKERS = 4
+
+# Queued-but-unfinished exports allowed per worker before submit() blocks
+_IN_FLIGHT_PER_WORKER = 4
 
 # Notion rich_text fields have a 2000-character limit
 _MAX_RICH_TEXT = 2000
@@ -47,16 +71,56 @@ _SETUP_PROPERTIES = {
         },
     },
     "PDF": {"files": {}},
+    "Message Hash": {"rich_text": {}},
 }
 
+# Optional rich_text property holding ParsedEmail.content_hash, so
+# duplicates are matched on content rather than subject and date
+_HASH_PROPERTY = "Message Hash"
+
+# Largest page_size accepted by data_sources.query
+_QUERY_PAGE_SIZE = 100
+
 
 def _require_notion_client():
-    """Raise a clear error if notion-client is not installed."""
-    if Client is None:
+    """Import notion-client on first use, raising a clear error if it is not installed.
+
+    Returns the Client class and the APIResponseError exception type.
+    """
+    try:
+        from notion_client import Client
+        from notion_client.errors import APIResponseError
+    except ImportError:
         raise click.ClickException(
             "notion-client is required for Notion export: pip install notion-client"
+        ) from None
+    return Client, APIResponseError
+
+
+def _retry_advice(error: Exception) -> RetryAdvice | None:
+    """Classify a notion-client error for ThrottledClient; None if permanent."""
+    status = getattr(error, "status", None)
+    if status in _RETRY_STATUSES:
+        headers = getattr(error, "headers", None) or {}
+        return RetryAdvice(
+            throttled=status == 429,
+            retry_after=parse_retry_after(headers.get("Retry-After")),
+            may_have_applied=status != 429,
         )
 
+    import httpx
+    from notion_client.errors import RequestTimeoutError
+
+    if isinstance(error, RequestTimeoutError):
+        # notion-client raises this from the httpx timeout it caught
+        error = error.__context__ or error
+    if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+        # The request never reached Notion
+        return RetryAdvice()
+    if isinstance(error, (RequestTimeoutError, httpx.TransportError)):
+        return RetryAdvice(may_have_applied=True)
+    return None
+
 
 def _get_data_source_id(client, database_id: str) -> str:
     """Retrieve the data_source ID for a database."""
@@ -91,12 +155,12 @@ def _upload_pdf_to_notion(client, pdf_path: Path) -> str | None:
         )
         file_upload_id = upload["id"]
 
-        with open(pdf_path, "rb") as f:
-            client.file_uploads.send(
-                file_upload_id,
-                file=(filename, f, "application/pdf"),
-                part_number="1",
-            )
+        # Send bytes rather than an open file, so a retried send starts over
+        client.file_uploads.send(
+            file_upload_id,
+            file=(filename, pdf_path.read_bytes(), "application/pdf"),
+            part_number="1",
+        )
 
         return file_upload_id
     except Exception as e:
@@ -104,7 +168,13 @@ def _upload_pdf_to_notion(client, pdf_path: Path) -> str | None:
         return None
 
 
-def _build_page_properties(email: ParsedEmail, key_points: list[str], *, pdf_upload_id: str | None = None) -> dict:
+def _build_page_properties(
+    email: ParsedEmail,
+    key_points: list[str],
+    *,
+    pdf_upload_id: str | None = None,
+    store_hash: bool = False,
+) -> dict:
     """Map a ParsedEmail and its key points to Notion page properties."""
     subject = email.subject or "No Subject"
     properties = {
@@ -122,18 +192,33 @@ def _build_page_properties(email: ParsedEmail, key_points: list[str], *, pdf_upl
     if email.date:
         properties["Date"] = {"date": {"start": email.date.isoformat()}}
 
+    if store_hash and email.content_hash:
+        properties[_HASH_PROPERTY] = _hash_property(email.content_hash)
+
     if pdf_upload_id:
-        properties["PDF"] = {
-            "files": [{
-                "type": "file_upload",
-                "file_upload": {"id": pdf_upload_id},
-                "name": f"{email.logical_filename[:96]}.pdf",
-            }]
-        }
+        properties["PDF"] = _pdf_property(pdf_upload_id, _pdf_name(email))
 
     return properties
 
 
+def _pdf_name(email: ParsedEmail) -> str:
+    return f"{email.logical_filename[:96]}.pdf"
+
+
+def _pdf_property(pdf_upload_id: str, name: str) -> dict:
+    return {
+        "files": [{
+            "type": "file_upload",
+            "file_upload": {"id": pdf_upload_id},
+            "name": name,
+        }]
+    }
+
+
+def _hash_property(content_hash: str) -> dict:
+    return {"rich_text": _make_rich_text(content_hash)}
+
+
 def _build_page_children(email: ParsedEmail, key_points: list[str]) -> list[dict]:
     """Build Notion block children for the page body."""
     children = [
@@ -192,7 +277,7 @@ def _build_page_children(email: ParsedEmail, key_points: list[str]) -> list[dict
     return children
 
 
-def _check_duplicate(client, data_source_id: str, email: ParsedEmail) -> bool:
+def _check_duplicate(client, data_source_id: str, email: ParsedEmail | OutboxEntry) -> bool:
     """Check if an email with the same subject and date already exists."""
     subject = email.subject or "No Subject"
 
@@ -220,6 +305,108 @@ def _check_duplicate(client, data_source_id: str, email: ParsedEmail) -> bool:
         return False
 
 
+def _plain_text(rich_text: list[dict]) -> str:
+    return "".join(
+        part.get("plain_text") or part.get("text", {}).get("content", "") for part in rich_text
+    )
+
+
+class DuplicateIndex:
+    """Pages already in a data source, for duplicate checks without queries.
+
+    Loaded once with one data_sources.query per 100 pages, instead of one
+    query per exported email. Pages carrying a message hash are matched on
+    it exactly; older pages without one are matched the way _check_duplicate
+    does, on title and date (or title alone for emails without a date).
+    Emails are claimed as they are exported, so copies within the same run
+    are caught too; they are indexed by hash when *store_hash* says the new
+    pages will carry one.
+    """
+
+    def __init__(self, store_hash: bool = False):
+        self.store_hash = store_hash
+        self.hashes: set[str] = set()
+        self.title_dates: set[tuple[str, str]] = set()
+        self.titles: Counter[str] = Counter()  # indexed pages per title
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.hashes) + sum(self.titles.values())
+
+    @staticmethod
+    def _keys(email: ParsedEmail | OutboxEntry) -> tuple[str, str | None]:
+        title = (email.subject or "No Subject")[:_MAX_RICH_TEXT]
+        return title, email.date.strftime("%Y-%m-%d") if email.date else None
+
+    def add_page(self, page: dict) -> None:
+        """Index one page object returned by data_sources.query."""
+        properties = page.get("properties", {})
+        content_hash = _plain_text(properties.get(_HASH_PROPERTY, {}).get("rich_text") or [])
+        if content_hash:
+            self.hashes.add(content_hash)
+            return
+        title = _plain_text(properties.get("Name", {}).get("title") or [])
+        date = (properties.get("Date", {}).get("date") or {}).get("start")
+        self._add(title, date[:10] if date else None)
+
+    def _add(self, title: str, date: str | None) -> None:
+        self.titles[title] += 1
+        if date:
+            self.title_dates.add((title, date))
+
+    def _contains(self, email: ParsedEmail | OutboxEntry) -> bool:
+        if email.content_hash and email.content_hash in self.hashes:
+            return True
+        title, date = self._keys(email)
+        if date is None:
+            return title in self.titles
+        return (title, date) in self.title_dates
+
+    def claim(self, email: ParsedEmail | OutboxEntry) -> bool:
+        """Return False if the email is a duplicate, else index it and return True."""
+        with self._lock:
+            if self._contains(email):
+                return False
+            if self.store_hash and email.content_hash:
+                self.hashes.add(email.content_hash)
+            else:
+                self._add(*self._keys(email))
+            return True
+
+    def release(self, email: ParsedEmail | OutboxEntry) -> None:
+        """Undo claim() for an email whose export failed.
+
+        Everything claim() added was new to the index, so it can be removed.
+        """
+        with self._lock:
+            if self.store_hash and email.content_hash:
+                self.hashes.discard(email.content_hash)
+                return
+            title, date = self._keys(email)
+            self.title_dates.discard((title, date))
+            self.titles[title] -= 1
+            if self.titles[title] <= 0:
+                del self.titles[title]
+
+
+def load_duplicate_index(target: "NotionTarget") -> DuplicateIndex:
+    """Page through the target's data source once and index every page."""
+    index = DuplicateIndex(target.store_hash)
+    cursor = None
+    while True:
+        kwargs = {"start_cursor": cursor} if cursor else {}
+        response = target.client.data_sources.query(
+            data_source_id=target.data_source_id, page_size=_QUERY_PAGE_SIZE, **kwargs,
+        )
+        for page in response.get("results", []):
+            index.add_page(page)
+        cursor = response.get("next_cursor")
+        if not response.get("has_more") or not cursor:
+            break
+    logger.info("Indexed %d existing Notion page(s) for duplicate checks", len(index))
+    return index
+
+
 def export_email_to_notion(
     client,
     database_id: str,
@@ -227,40 +414,135 @@ def export_email_to_notion(
     key_points: list[str],
     *,
     pdf_path: Path | None = None,
+    store_hash: bool = False,
 ) -> str:
-    """Export a single email to Notion. Returns the created page ID."""
-    pdf_upload_id = None
-    if pdf_path and pdf_path.exists():
-        pdf_upload_id = _upload_pdf_to_notion(client, pdf_path)
-
-    properties = _build_page_properties(email, key_points, pdf_upload_id=pdf_upload_id)
-    children = _build_page_children(email, key_points)
-
-    response = client.pages.create(
-        parent={"database_id": database_id},
-        properties=properties,
-        children=children,
+    """Export a single email to Notion. Returns the created page ID.
+
+    With *store_hash*, the email's content hash is saved in the
+    'Message Hash' property for later duplicate checks.
+    """
+    entry = prepare_entry(email, key_points, pdf_path=pdf_path)
+    return _create_page(client, database_id, entry, attach_pdf=True, store_hash=store_hash)
+
+
+def prepare_entry(email: ParsedEmail, key_points: list[str], *, pdf_path: Path | None = None) -> OutboxEntry:
+    """Build the page payload for an email, ready to queue or send."""
+    return OutboxEntry(
+        content_hash=email.content_hash,
+        subject=email.subject,
+        date=email.date,
+        properties=_build_page_properties(email, key_points),
+        children=_build_page_children(email, key_points),
+        pdf_path=pdf_path,
+        pdf_name=_pdf_name(email),
     )
 
-    return response["id"]
+
+def _find_page_by_hash(client, data_source_id: str, content_hash: str) -> str | None:
+    """Return the ID of a page whose 'Message Hash' is *content_hash*, if any."""
+    response = client.data_sources.query(
+        data_source_id=data_source_id,
+        filter={"property": _HASH_PROPERTY, "rich_text": {"equals": content_hash}},
+        page_size=1,
+    )
+    results = response.get("results", [])
+    return results[0]["id"] if results else None
 
 
-def export_emails_to_notion(
-    emails: list[ParsedEmail],
+def _create_page(
+    client,
     database_id: str,
-    token: str,
-    sentences: int = 3,
+    entry: OutboxEntry,
     *,
-    skip_duplicates: bool = True,
-    pdf_paths: dict[Path, Path] | None = None,
-) -> list[tuple[ParsedEmail, str]]:
-    """Export emails to a Notion database.
+    attach_pdf: bool,
+    store_hash: bool,
+    data_source_id: str | None = None,
+) -> str:
+    """Upload the entry's PDF if wanted, then create its page. Returns the page ID.
 
-    Returns a list of (email, page_id) tuples for successfully exported emails.
+    pages.create is not retried by the client when the page may have been
+    created anyway (a server error or a lost response). With *store_hash*
+    and a *data_source_id*, the page is then looked up by its hash and
+    only created again if it is not there.
     """
-    _require_notion_client()
+    properties = dict(entry.properties)
+    recoverable = bool(store_hash and entry.content_hash and data_source_id)
+    if store_hash and entry.content_hash:
+        properties[_HASH_PROPERTY] = _hash_property(entry.content_hash)
+    if attach_pdf and entry.pdf_path and entry.pdf_path.exists():
+        pdf_upload_id = _upload_pdf_to_notion(client, entry.pdf_path)
+        if pdf_upload_id:
+            properties["PDF"] = _pdf_property(pdf_upload_id, entry.pdf_name or entry.pdf_path.name)
+
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            response = client.pages.create(
+                parent={"database_id": database_id},
+                properties=properties,
+                children=entry.children,
+            )
+            return response["id"]
+        except Exception as e:
+            advice = _retry_advice(e)
+            if not (recoverable and advice and advice.may_have_applied) or attempt == MAX_ATTEMPTS - 1:
+                raise
+            page_id = _find_page_by_hash(client, data_source_id, entry.content_hash)
+            if page_id:
+                logger.info("Page for '%s' was created despite the error (%s)", entry.subject, e)
+                return page_id
+            delay = backoff_delay(attempt)
+            logger.warning(
+                "Creating the page for '%s' failed (%s); retrying in %.1fs", entry.subject, e, delay,
+            )
+            time.sleep(delay)
 
-    client = Client(auth=token)
+
+@dataclass
+class NotionTarget:
+    """A validated Notion database that emails can be exported to.
+
+    *client* is rate limited, so it can be shared by several threads.
+    *store_hash* is set when the database has a 'Message Hash' property.
+    """
+    client: object
+    database_id: str
+    data_source_id: str
+    attach_pdfs: bool
+    store_hash: bool = False
+
+
+def connect_notion_target(
+    database_id: str,
+    token: str,
+    *,
+    attach_pdfs: bool = False,
+    requests_per_second: float = NOTION_REQUESTS_PER_SECOND,
+    api_url: str | None = None,
+) -> NotionTarget:
+    """Connect to a Notion database and validate its schema.
+
+    attach_pdfs is switched off if the database has no 'PDF' files property.
+    All requests through the target's client share one rate limit, which
+    drops while Notion is throttling. Rate-limit, server and network errors
+    are retried with backoff (honoring Retry-After) before an export fails;
+    calls that create pages or uploads are only retried when they cannot
+    have gone through (see _create_page for pages).
+    api_url replaces https://api.notion.com, e.g. with a local stand-in.
+
+    Configuration problems (token, database, schema) raise ClickException.
+    Errors meaning Notion is unavailable for now (throttling or server
+    errors that outlast the retries, network failures) are raised as they
+    are, so callers can queue pages and carry on.
+    """
+    Client, APIResponseError = _require_notion_client()
+
+    options = {"base_url": api_url.rstrip("/")} if api_url else {}
+    client = ThrottledClient(
+        Client(auth=token, **options),
+        RateLimiter(requests_per_second),
+        classify=_retry_advice,
+        unsafe=_NOT_IDEMPOTENT,
+    )
 
     # Validate connection and get data source
     try:
@@ -276,6 +558,8 @@ def export_emails_to_notion(
                 "Notion database not found. Check your NOTION_DATABASE_ID and ensure "
                 "the integration has access to the database."
             )
+        if e.status in _RETRY_STATUSES:
+            raise
         raise click.ClickException(f"Notion API error: {e}")
 
     data_source_id = _get_data_source_id(client, database_id)
@@ -297,35 +581,227 @@ def export_emails_to_notion(
                     f"Use --notion-setup to create a properly configured database."
                 )
 
-    # Check if database has PDF property when pdf_paths are provided
-    if pdf_paths and "PDF" not in ds_properties:
+    # Check if database has PDF property when PDFs should be attached
+    if attach_pdfs and "PDF" not in ds_properties:
         logger.warning(
             "Database is missing 'PDF' files property — PDFs will not be attached. "
             "Recreate the database with --notion-setup to include it."
         )
-        pdf_paths = None
+        attach_pdfs = False
 
-    results = []
-    for email in emails:
-        try:
-            if skip_duplicates and _check_duplicate(client, data_source_id, email):
-                logger.info("Skipping duplicate: %s", email.subject)
-                continue
+    store_hash = ds_properties.get(_HASH_PROPERTY, {}).get("type") == "rich_text"
 
-            text_content = get_text_content(email)
-            key_points = extract_key_points(text_content, sentences)
+    return NotionTarget(client, database_id, data_source_id, attach_pdfs, store_hash)
 
-            pdf_path = pdf_paths.get(email.filepath) if pdf_paths else None
-            page_id = export_email_to_notion(
-                client, database_id, email, key_points, pdf_path=pdf_path,
-            )
-            results.append((email, page_id))
-            logger.info("Exported: %s -> %s", email.subject, page_id)
 
-        except Exception as e:
-            logger.error("Failed to export '%s' to Notion: %s", email.subject, e)
+def export_email_to_target(
+    target: NotionTarget,
+    email: ParsedEmail,
+    sentences: int = 3,
+    *,
+    skip_duplicates: bool = True,
+    pdf_path: Path | None = None,
+    artifacts: EmailArtifacts | None = None,
+) -> str | None:
+    """Export one email to a connected Notion target.
+
+    Returns the page ID, or None if the email was a duplicate or failed.
+    """
+    try:
+        artifacts = artifacts or EmailArtifacts(email)
+        entry = prepare_entry(email, artifacts.key_points(sentences), pdf_path=pdf_path)
+    except Exception as e:
+        logger.error("Failed to export '%s' to Notion: %s", email.subject, e)
+        return None
+    return _send_entry(target, entry, skip_duplicates=skip_duplicates).page_id
+
+
+def _send_entry(
+    target: NotionTarget,
+    entry: OutboxEntry,
+    *,
+    skip_duplicates: bool,
+    duplicates: DuplicateIndex | None = None,
+) -> ExportResult:
+    """Create the page for a prepared entry; safe to run in a worker thread.
+
+    Duplicates are looked up in *duplicates* when given, otherwise queried
+    one entry at a time.
+    """
+    if skip_duplicates and duplicates is not None and not duplicates.claim(entry):
+        logger.info("Skipping duplicate: %s", entry.subject)
+        return ExportResult(duplicate=True)
+    try:
+        if skip_duplicates and duplicates is None and _check_duplicate(
+            target.client, target.data_source_id, entry,
+        ):
+            logger.info("Skipping duplicate: %s", entry.subject)
+            return ExportResult(duplicate=True)
+
+        page_id = _create_page(
+            target.client,
+            target.database_id,
+            entry,
+            attach_pdf=target.attach_pdfs,
+            store_hash=target.store_hash,
+            data_source_id=target.data_source_id,
+        )
+    except Exception as e:
+        logger.error("Failed to export '%s' to Notion: %s", entry.subject, e)
+        if skip_duplicates and duplicates is not None:
+            duplicates.release(entry)
+        return ExportResult(error=str(e))
+
+    logger.info("Exported: %s -> %s", entry.subject, page_id)
+    return ExportResult(page_id=page_id)
+
+
+class NotionExporter:
+    """Send prepared entries to a NotionTarget from a pool of threads.
+
+    Each page costs up to four requests (duplicate check, PDF upload and
+    send, page create), and most of an export is spent waiting on them.
+    Running *workers* exports at once keeps the target's rate limit busy.
+
+    Entries are prepared by the caller (see prepare_entry), so
+    summarization and any SQLite store stay on the calling thread. Results
+    come back in submission order as (entry, ExportResult) pairs.
+
+    With *skip_duplicates*, the database's pages are indexed up front (see
+    DuplicateIndex). If that fails, each entry is checked with its own query.
+    """
+
+    def __init__(self, target: NotionTarget, *, workers: int = NOTION_WORKERS, skip_duplicates: bool = True):
+        self.target = target
+        self.skip_duplicates = skip_duplicates
+        self.duplicates = None
+        if skip_duplicates:
+            try:
+                self.duplicates = load_duplicate_index(target)
+            except Exception as e:
+                logger.warning("Could not index existing Notion pages, checking one by one: %s", e)
+        self.max_pending = workers * _IN_FLIGHT_PER_WORKER
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="notion-export")
+        self._pending: deque[tuple[OutboxEntry, Future]] = deque()
+
+    def submit(self, entry: OutboxEntry) -> list[tuple[OutboxEntry, ExportResult]]:
+        """Queue one entry and return any exports that have finished.
+
+        Blocks while max_pending exports are unfinished, so entries don't
+        pile up faster than Notion accepts them.
+        """
+        finished = []
+        if len(self._pending) >= self.max_pending:
+            entry_done, future = self._pending.popleft()
+            finished.append((entry_done, future.result()))
+        future = self._pool.submit(
+            _send_entry, self.target, entry,
+            skip_duplicates=self.skip_duplicates, duplicates=self.duplicates,
+        )
+        self._pending.append((entry, future))
+        return finished + self.completed()
 
-    return results
+    def completed(self) -> list[tuple[OutboxEntry, ExportResult]]:
+        """Return finished exports from the front of the queue without waiting."""
+        finished = []
+        while self._pending and self._pending[0][1].done():
+            entry, future = self._pending.popleft()
+            finished.append((entry, future.result()))
+        return finished
+
+    def finish(self) -> list[tuple[OutboxEntry, ExportResult]]:
+        """Wait for every queued export and return them all."""
+        finished = []
+        while self._pending:
+            entry, future = self._pending.popleft()
+            finished.append((entry, future.result()))
+        return finished
+
+    def close(self) -> None:
+        """Wait for queued exports and stop the worker threads."""
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def drain_outbox(outbox: NotionOutbox, exporter: NotionExporter) -> tuple[int, int, int]:
+    """Send every pending outbox entry, recording each outcome as it lands.
+
+    Safe to interrupt and run again: only pending entries are sent, and
+    with duplicate checks on, pages created just before an interruption
+    are recognized and not created twice.
+
+    Returns (sent, duplicates, failed) counts.
+    """
+    counts = {"sent": 0, "duplicate": 0, "failed": 0}
+
+    def record(results: list[tuple[OutboxEntry, ExportResult]]) -> None:
+        for entry, result in results:
+            outbox.record(entry, result)
+            if result.page_id:
+                counts["sent"] += 1
+            elif result.duplicate:
+                counts["duplicate"] += 1
+            else:
+                counts["failed"] += 1
+
+    try:
+        for entry in outbox.pending():
+            record(exporter.submit(entry))
+        record(exporter.finish())
+    finally:
+        outbox.flush()
+    return counts["sent"], counts["duplicate"], counts["failed"]
+
+
+def export_emails_to_notion(
+    emails: list[ParsedEmail],
+    database_id: str,
+    token: str,
+    sentences: int = 3,
+    *,
+    skip_duplicates: bool = True,
+    pdf_paths: dict[Path, Path] | None = None,
+    key_point_store: KeyPointStore | None = None,
+    workers: int = NOTION_WORKERS,
+    requests_per_second: float = NOTION_REQUESTS_PER_SECOND,
+) -> list[tuple[ParsedEmail, str]]:
+    """Export emails to a Notion database.
+
+    Key points are read from and saved to *key_point_store*, so a report
+    built from the same store doesn't summarize the emails again. Up to
+    *workers* emails are exported at once, within *requests_per_second*.
+
+    Returns a list of (email, page_id) tuples for successfully exported emails.
+    """
+    target = connect_notion_target(
+        database_id, token, attach_pdfs=bool(pdf_paths), requests_per_second=requests_per_second,
+    )
+
+    submitted = []
+    finished = []
+    with NotionExporter(target, workers=workers, skip_duplicates=skip_duplicates) as exporter:
+        for email in emails:
+            pdf_path = pdf_paths.get(email.filepath) if pdf_paths else None
+            try:
+                key_points = EmailArtifacts(email, key_point_store).key_points(sentences)
+            except Exception as e:
+                logger.error("Failed to export '%s' to Notion: %s", email.subject, e)
+                continue
+            submitted.append(email)
+            finished.extend(exporter.submit(prepare_entry(email, key_points, pdf_path=pdf_path)))
+        finished.extend(exporter.finish())
+
+    # Results come back in submission order
+    return [
+        (email, result.page_id)
+        for email, (_, result) in zip(submitted, finished)
+        if result.page_id
+    ]
 
 
 def setup_notion_database(token: str, parent_page_id: str, title: str = "Email Archive") -> str:
@@ -334,7 +810,7 @@ def setup_notion_database(token: str, parent_page_id: str, title: str = "Email A
     Creates the database, then adds properties via the data_sources API.
     Returns the new database ID.
     """
-    _require_notion_client()
+    Client, APIResponseError = _require_notion_client()
 
     client = Client(auth=token)
 
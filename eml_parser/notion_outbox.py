@@ -0,0 +1,205 @@
+"""Durable queue of prepared Notion pages, sent separately from processing."""
+
+import json
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+# Entry states
+PENDING = "pending"
+SENT = "sent"
+DUPLICATE = "duplicate"
+
+# Writes between commits; pages sent but not yet committed are found again
+# by the duplicate check when the outbox is drained after a crash
+_COMMIT_INTERVAL = 20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY,
+    content_hash TEXT UNIQUE,
+    subject TEXT NOT NULL,
+    date TEXT,
+    properties TEXT NOT NULL,
+    children TEXT NOT NULL,
+    pdf_path TEXT,
+    pdf_name TEXT,
+    status TEXT NOT NULL,
+    page_id TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    queued REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS outbox_status ON outbox (status, id);
+"""
+
+_COLUMNS = "id, content_hash, subject, date, properties, children, pdf_path, pdf_name, status, page_id"
+
+
+@dataclass
+class OutboxEntry:
+    """A Notion page ready to be created, without any open resources.
+
+    *properties* and *children* are the page payload built from the email.
+    The PDF is uploaded only when the page is sent, since Notion file
+    uploads expire; *pdf_name* is the name shown for it. *subject*, *date*
+    and *content_hash* identify the email for duplicate checks.
+    """
+    content_hash: str
+    subject: str
+    date: datetime | None
+    properties: dict
+    children: list[dict]
+    pdf_path: Path | None = None
+    pdf_name: str | None = None
+    status: str = PENDING
+    page_id: str | None = None
+    id: int | None = None
+
+
+@dataclass
+class ExportResult:
+    """Outcome of sending one entry: a page ID, a duplicate, or an error."""
+    page_id: str | None = None
+    duplicate: bool = False
+    error: str | None = None
+
+
+def _entry_from_row(row: tuple) -> OutboxEntry:
+    entry_id, content_hash, subject, date, properties, children, pdf_path, pdf_name, status, page_id = row
+    return OutboxEntry(
+        content_hash=content_hash or "",
+        subject=subject,
+        date=datetime.fromisoformat(date) if date else None,
+        properties=json.loads(properties),
+        children=json.loads(children),
+        pdf_path=Path(pdf_path) if pdf_path else None,
+        pdf_name=pdf_name,
+        status=status,
+        page_id=page_id,
+        id=entry_id,
+    )
+
+
+class NotionOutbox:
+    """SQLite outbox of Notion pages waiting to be created.
+
+    Processing adds one entry per email; entries are then sent, either
+    right away while Notion is reachable or later by --notion-drain. Each
+    email is queued once (by content hash), and sent or duplicate entries
+    are never sent again, so draining is safe to repeat or interrupt.
+    """
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._pending_writes = 0
+
+    def add(self, entry: OutboxEntry) -> OutboxEntry:
+        """Queue an entry and return it as stored.
+
+        If the same email was queued before, the stored entry is returned
+        instead, with its status and page ID.
+        """
+        self._conn.execute(
+            "INSERT INTO outbox (content_hash, subject, date, properties, children, "
+            "pdf_path, pdf_name, status, queued) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (content_hash) DO NOTHING",
+            (
+                entry.content_hash or None,
+                entry.subject,
+                entry.date.isoformat() if entry.date else None,
+                json.dumps(entry.properties),
+                json.dumps(entry.children),
+                str(entry.pdf_path) if entry.pdf_path else None,
+                entry.pdf_name,
+                PENDING,
+                time.time(),
+            ),
+        )
+        self._note_write()
+        if entry.content_hash:
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM outbox WHERE content_hash = ?", (entry.content_hash,)
+            ).fetchone()
+        else:
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM outbox WHERE id = last_insert_rowid()"
+            ).fetchone()
+        return _entry_from_row(row)
+
+    def pending(self) -> Iterator[OutboxEntry]:
+        """Yield entries still to be sent, oldest first.
+
+        Rows are read in pages by id, so entries can be marked (and
+        committed) while iterating.
+        """
+        last_id = 0
+        while True:
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM outbox WHERE status = ? AND id > ? ORDER BY id LIMIT 100",
+                (PENDING, last_id),
+            ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield _entry_from_row(row)
+            last_id = rows[-1][0]
+
+    def pending_count(self) -> int:
+        (count,) = self._conn.execute(
+            "SELECT COUNT(*) FROM outbox WHERE status = ?", (PENDING,)
+        ).fetchone()
+        return count
+
+    def record(self, entry: OutboxEntry, result: ExportResult) -> None:
+        """Store the outcome of sending an entry.
+
+        Failed entries stay pending, with the error kept for inspection.
+        """
+        if result.page_id:
+            self._set_status(entry, SENT, result.page_id)
+        elif result.duplicate:
+            self._set_status(entry, DUPLICATE, None)
+        else:
+            self._conn.execute(
+                "UPDATE outbox SET attempts = attempts + 1, last_error = ? WHERE id = ?",
+                (result.error, entry.id),
+            )
+            self._note_write()
+
+    def _set_status(self, entry: OutboxEntry, status: str, page_id: str | None) -> None:
+        entry.status = status
+        entry.page_id = page_id
+        self._conn.execute(
+            "UPDATE outbox SET status = ?, page_id = ?, last_error = NULL WHERE id = ?",
+            (status, page_id, entry.id),
+        )
+        self._note_write()
+
+    def _note_write(self) -> None:
+        self._pending_writes += 1
+        if self._pending_writes >= _COMMIT_INTERVAL:
+            self.flush()
+
+    def flush(self) -> None:
+        """Commit pending writes."""
+        self._conn.commit()
+        self._pending_writes = 0
+
+    def close(self) -> None:
+        """Flush and close the database."""
+        self.flush()
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,19 +1,26 @@
 """Parse .eml files from a directory."""
 
 import email
+import hashlib
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
 from datetime import datetime
 from email.header import decode_header
+from email.message import Message
 from email.utils import parsedate_to_datetime
+from itertools import islice
 from pathlib import Path
-from typing import Iterator
-
-import chardet
+from typing import Iterable, Iterator
 
 from .utils import get_logger
 
 logger = get_logger(__name__)
 
+# Parsed-but-unconsumed results allowed per worker in parallel scans
+_IN_FLIGHT_PER_WORKER = 4
+
 
 @dataclass
 class ParsedEmail:
@@ -25,6 +32,8 @@ class ParsedEmail:
     date: datetime | None
     plain_body: str
     html_body: str
+    message_id: str = ""
+    content_hash: str = ""  # SHA-256 of the raw message bytes
 
     @property
     def filename_safe_subject(self) -> str:
@@ -58,12 +67,52 @@ def decode_mime_header(header_value: str | None) -> str:
     return " ".join(decoded_parts)
 
 
-def detect_encoding(filepath: Path) -> str:
-    """Detect the encoding of a file using chardet."""
-    with open(filepath, "rb") as f:
-        raw = f.read()
-        result = chardet.detect(raw)
-        return result.get("encoding") or "utf-8"
+# Only the leading bytes are inspected when validating a file
+_VALIDATION_BYTES = 4096
+
+# Standard email headers used to recognise an email file
+_EMAIL_INDICATORS = (
+    b"from:",
+    b"to:",
+    b"subject:",
+    b"date:",
+    b"mime-version:",
+    b"content-type:",
+    b"received:",
+)
+
+
+def _decode_bytes(raw: bytes, charset: str | None = None) -> str:
+    """Decode bytes using a declared charset, falling back to UTF-8 then chardet.
+
+    chardet only runs on the given bytes (a single MIME part or header), never
+    on the whole message.
+    """
+    if charset:
+        try:
+            return raw.decode(charset, errors="replace")
+        except LookupError:
+            pass
+
+    try:
+        return raw.decode("utf-8")
+    except UnicodeDecodeError:
+        import chardet
+
+        detected = chardet.detect(raw).get("encoding") or "utf-8"
+        try:
+            return raw.decode(detected, errors="replace")
+        except LookupError:
+            return raw.decode("utf-8", errors="replace")
+
+
+def is_valid_eml_bytes(data: bytes) -> bool:
+    """Validate that raw message bytes appear to be an email."""
+    header = data[:_VALIDATION_BYTES].lower()
+
+    # File should contain at least 2 email headers to be considered valid
+    matches = sum(1 for indicator in _EMAIL_INDICATORS if indicator in header)
+    return matches >= 2
 
 
 def is_valid_eml_file(filepath: Path) -> bool:
@@ -71,46 +120,49 @@ def is_valid_eml_file(filepath: Path) -> bool:
     # Check for common email headers in the first 4KB
     try:
         with open(filepath, "rb") as f:
-            header = f.read(4096).lower()
-
-        # Look for standard email headers
-        email_indicators = [
-            b"from:",
-            b"to:",
-            b"subject:",
-            b"date:",
-            b"mime-version:",
-            b"content-type:",
-            b"received:",
-        ]
-
-        # File should contain at least 2 email headers to be considered valid
-        matches = sum(1 for indicator in email_indicators if indicator in header)
-        return matches >= 2
+            return is_valid_eml_bytes(f.read(_VALIDATION_BYTES))
     except (IOError, OSError):
         return False
 
 
-def parse_eml_file(filepath: Path) -> ParsedEmail:
-    """Parse a single .eml file."""
-    encoding = detect_encoding(filepath)
+def _get_header(msg: Message, name: str) -> str | None:
+    """Return a header as str, decoding any raw 8-bit bytes it carries."""
+    for key, value in msg.raw_items():
+        if key.lower() == name.lower():
+            # Undeclared 8-bit bytes are kept as surrogate escapes by the parser
+            raw = value.encode("ascii", "surrogateescape")
+            return _decode_bytes(raw)
+    return None
+
 
-    with open(filepath, "r", encoding=encoding, errors="replace") as f:
-        msg = email.message_from_file(f)
+def _decode_part(part: Message) -> str:
+    """Decode a text MIME part using its own declared charset."""
+    payload = part.get_payload(decode=True)
+    if not payload:
+        return ""
+    return _decode_bytes(payload, part.get_content_charset())
+
+
+def parse_eml_bytes(data: bytes, filepath: Path) -> ParsedEmail:
+    """Parse raw .eml bytes that were read from *filepath*."""
+    msg = email.message_from_bytes(data)
 
-    subject = decode_mime_header(msg.get("Subject"))
-    sender = decode_mime_header(msg.get("From"))
+    subject = decode_mime_header(_get_header(msg, "Subject"))
+    sender = decode_mime_header(_get_header(msg, "From"))
 
     recipients = []
     for header in ["To", "Cc"]:
-        if msg.get(header):
+        value = _get_header(msg, header)
+        if value:
             recipients.extend(
                 decode_mime_header(r.strip())
-                for r in msg.get(header).split(",")
+                for r in value.split(",")
             )
 
+    message_id = (_get_header(msg, "Message-ID") or "").strip()
+
     date = None
-    date_str = msg.get("Date")
+    date_str = _get_header(msg, "Date")
     if date_str:
         try:
             date = parsedate_to_datetime(date_str)
@@ -124,25 +176,15 @@ def parse_eml_file(filepath: Path) -> ParsedEmail:
         for part in msg.walk():
             content_type = part.get_content_type()
             if content_type == "text/plain" and not plain_body:
-                payload = part.get_payload(decode=True)
-                if payload:
-                    charset = part.get_content_charset() or "utf-8"
-                    plain_body = payload.decode(charset, errors="replace")
+                plain_body = _decode_part(part)
             elif content_type == "text/html" and not html_body:
-                payload = part.get_payload(decode=True)
-                if payload:
-                    charset = part.get_content_charset() or "utf-8"
-                    html_body = payload.decode(charset, errors="replace")
+                html_body = _decode_part(part)
     else:
-        content_type = msg.get_content_type()
-        payload = msg.get_payload(decode=True)
-        if payload:
-            charset = msg.get_content_charset() or "utf-8"
-            content = payload.decode(charset, errors="replace")
-            if content_type == "text/html":
-                html_body = content
-            else:
-                plain_body = content
+        content = _decode_part(msg)
+        if msg.get_content_type() == "text/html":
+            html_body = content
+        else:
+            plain_body = content
 
     return ParsedEmail(
         filepath=filepath,
@@ -152,25 +194,94 @@ def parse_eml_file(filepath: Path) -> ParsedEmail:
         date=date,
         plain_body=plain_body,
         html_body=html_body,
+        message_id=message_id,
+        content_hash=hashlib.sha256(data).hexdigest(),
     )
 
 
-def scan_directory(directory: Path) -> Iterator[ParsedEmail]:
-    """Scan a directory for .eml files and parse them."""
-    eml_files = sorted(directory.glob("*.eml"))
+def parse_eml_file(filepath: Path) -> ParsedEmail:
+    """Parse a single .eml file."""
+    return parse_eml_bytes(filepath.read_bytes(), filepath)
 
-    for filepath in eml_files:
-        # Skip symlinks to prevent path traversal attacks
-        if filepath.is_symlink():
-            logger.warning("Skipping symlink %s", filepath)
-            continue
 
-        # Validate file appears to be an email
-        if not is_valid_eml_file(filepath):
-            logger.warning("Skipping invalid email file %s", filepath)
-            continue
+def _load_eml(filepath: Path) -> tuple[ParsedEmail | None, str | None]:
+    """Read, validate and parse one file.
 
-        try:
-            yield parse_eml_file(filepath)
-        except Exception as e:
-            logger.warning("Failed to parse %s: %s", filepath, e)
+    Returns (email, None) on success or (None, warning) when the file is
+    skipped. Warnings are returned rather than logged so worker processes
+    don't need their own logging setup.
+    """
+    # Skip symlinks to prevent path traversal attacks
+    if filepath.is_symlink():
+        return None, f"Skipping symlink {filepath}"
+
+    # Read each file once; validation and parsing share the same bytes
+    try:
+        data = filepath.read_bytes()
+    except OSError as e:
+        return None, f"Failed to read {filepath}: {e}"
+
+    # Validate file appears to be an email
+    if not is_valid_eml_bytes(data):
+        return None, f"Skipping invalid email file {filepath}"
+
+    try:
+        return parse_eml_bytes(data, filepath), None
+    except Exception as e:
+        return None, f"Failed to parse {filepath}: {e}"
+
+
+def _load_parallel(
+    eml_files: Iterable[Path], workers: int, executor: Executor | None = None
+) -> Iterator[tuple[ParsedEmail | None, str | None]]:
+    """Load files in a process pool, yielding results in input order.
+
+    At most ``workers * _IN_FLIGHT_PER_WORKER`` files are submitted at once,
+    so parsed bodies don't pile up faster than the caller consumes them.
+    A given *executor* is used as is (and left running) instead of a new pool.
+    """
+    max_in_flight = workers * _IN_FLIGHT_PER_WORKER
+    files = iter(eml_files)
+    pending: deque[Future] = deque()
+
+    pool = nullcontext(executor) if executor else ProcessPoolExecutor(max_workers=workers)
+    with pool as executor:
+        for filepath in islice(files, max_in_flight):
+            pending.append(executor.submit(_load_eml, filepath))
+
+        while pending:
+            result = pending.popleft().result()
+            next_file = next(files, None)
+            if next_file is not None:
+                pending.append(executor.submit(_load_eml, next_file))
+            yield result
+
+
+def scan_directory(directory: Path, workers: int = 1) -> Iterator[ParsedEmail]:
+    """Scan a directory for .eml files and parse them.
+
+    With workers > 1, files are parsed in a process pool. Emails are still
+    yielded in sorted filename order.
+    """
+    return parse_eml_files(sorted(directory.glob("*.eml")), workers)
+
+
+def parse_eml_files(
+    eml_files: list[Path], workers: int = 1, *, executor: Executor | None = None
+) -> Iterator[ParsedEmail]:
+    """Parse the given .eml files, skipping (and logging) unreadable ones.
+
+    With workers > 1, files are parsed in a process pool: *executor* if
+    given, otherwise one created for this call. Emails are yielded in the
+    order given.
+    """
+    if workers > 1 and len(eml_files) > 1:
+        results = _load_parallel(eml_files, workers, executor)
+    else:
+        results = map(_load_eml, eml_files)
+
+    for parsed, warning in results:
+        if warning:
+            logger.warning("%s", warning)
+            continue
+        yield parsed
@@ -1,12 +1,13 @@
 """Convert emails to PDF format."""
 
 import re
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from weasyprint import HTML, CSS
-from weasyprint.text.fonts import FontConfiguration
-
-from .extractor import get_html_for_pdf
+from .extractor import EmailArtifacts
 from .parser import ParsedEmail
 from .utils import (
     build_email_header_html,
@@ -15,44 +16,118 @@ from .utils import (
     inject_header_into_html,
 )
 
+if TYPE_CHECKING:
+    from weasyprint import CSS
+    from weasyprint.text.fonts import FontConfiguration
+
 logger = get_logger(__name__)
 
 
+# Disable hyphenation to avoid pyphen character range errors
+PAGE_CSS = """
+    @page {
+        size: letter;
+        margin: 1in;
+    }
+    * {
+        hyphens: none !important;
+        -webkit-hyphens: none !important;
+    }
+    body {
+        font-family: Arial, Helvetica, sans-serif;
+        font-size: 11pt;
+        line-height: 1.4;
+    }
+    img {
+        max-width: 100%;
+        height: auto;
+    }
+    a {
+        color: #0066cc;
+    }
+"""
+
+
+@lru_cache(maxsize=None)
+def get_render_resources() -> tuple["FontConfiguration", "CSS"]:
+    """Return the font configuration and page stylesheet for this process.
+
+    Font discovery and CSS parsing are the same for every email, so they are
+    done once per process (or pool worker) and shared by all renders.
+    WeasyPrint adds a document's @font-face rules to the font configuration
+    it renders with, so emails declaring fonts get their own (see
+    _font_config_for). WeasyPrint itself is imported here, on first use.
+    """
+    from weasyprint import CSS
+    from weasyprint.text.fonts import FontConfiguration
+
+    font_config = FontConfiguration()
+    css = CSS(string=PAGE_CSS, font_config=font_config)
+    return font_config, css
+
+
+# Emails whose HTML declares fonts
+_FONT_FACE = re.compile(r"@font-face", re.IGNORECASE)
+
+
+def _font_config_for(html_content: str) -> "FontConfiguration":
+    """Return the font configuration to render *html_content* with.
+
+    The shared one is used unless the HTML declares fonts, which would
+    otherwise stay registered for later emails and pile up in long runs.
+    """
+    font_config, _ = get_render_resources()
+    if _FONT_FACE.search(html_content):
+        from weasyprint.text.fonts import FontConfiguration
+
+        font_config = FontConfiguration()
+    return font_config
+
+
+# Characters removed before rendering: zero-width/invisible characters, misc
+# symbols and supplementary-plane characters (emoji) that cause pyphen issues
+_PDF_UNSAFE_CHARS = re.compile(
+    r'[\u200b-\u200f\u2028-\u202f\u2060-\u206f\ufeff\u2600-\u27bf\U00010000-\U0010ffff]+'
+)
+
+# Problematic Unicode characters and their safe alternatives
+_PDF_REPLACEMENTS = {
+    '\u2018': "'",  # Left single quote
+    '\u2019': "'",  # Right single quote
+    '\u201c': '"',  # Left double quote
+    '\u201d': '"',  # Right double quote
+    '\u2014': '-',  # Em dash
+    '\u2013': '-',  # En dash
+    '\u2026': '...',  # Ellipsis
+    '\u00a0': ' ',  # Non-breaking space
+}
+
+
 def sanitize_html_for_pdf(html_content: str) -> str:
     """Sanitize HTML content to avoid PDF rendering issues."""
-    # Remove zero-width and invisible characters
-    html_content = re.sub(r'[\u200b-\u200f\u2028-\u202f\u2060-\u206f\ufeff]', '', html_content)
-
-    # Replace problematic Unicode characters with safe alternatives
-    replacements = {
-        '\u2018': "'",  # Left single quote
-        '\u2019': "'",  # Right single quote
-        '\u201c': '"',  # Left double quote
-        '\u201d': '"',  # Right double quote
-        '\u2014': '-',  # Em dash
-        '\u2013': '-',  # En dash
-        '\u2026': '...',  # Ellipsis
-        '\u00a0': ' ',  # Non-breaking space
-    }
-    for char, replacement in replacements.items():
-        html_content = html_content.replace(char, replacement)
+    # Nothing to remove or replace in pure ASCII
+    if html_content.isascii():
+        return html_content
 
-    # Remove emojis and other high Unicode characters that cause pyphen issues
-    result = []
-    for char in html_content:
-        code = ord(char)
-        if code > 0xFFFF:  # Emoji and other supplementary characters
-            continue
-        if 0x2600 <= code <= 0x27BF:  # Misc symbols
-            continue
-        result.append(char)
+    html_content = _PDF_UNSAFE_CHARS.sub('', html_content)
+    for char, replacement in _PDF_REPLACEMENTS.items():
+        if char in html_content:
+            html_content = html_content.replace(char, replacement)
 
-    return ''.join(result)
+    return html_content
 
 
-def email_to_pdf(email: ParsedEmail, output_path: Path) -> Path:
+def email_to_pdf(
+    email: ParsedEmail,
+    output_path: Path,
+    *,
+    artifacts: EmailArtifacts | None = None,
+) -> Path:
     """Convert a parsed email to PDF."""
-    html_content = get_html_for_pdf(email)
+    from weasyprint import HTML
+
+    artifacts = artifacts or EmailArtifacts(email)
+    html_content = artifacts.render_html
 
     # Sanitize to avoid encoding issues
     html_content = sanitize_html_for_pdf(html_content)
@@ -66,52 +141,128 @@ def email_to_pdf(email: ParsedEmail, output_path: Path) -> Path:
     header_html = build_email_header_html(subject, sender, recipients, email.date, styled=True)
     html_content = inject_header_into_html(html_content, header_html)
 
-    font_config = FontConfiguration()
+    _, css = get_render_resources()
+    html = HTML(string=html_content)
+    html.write_pdf(output_path, stylesheets=[css], font_config=_font_config_for(html_content))
 
-    # Disable hyphenation to avoid pyphen character range errors
-    css = CSS(string="""
-        @page {
-            size: letter;
-            margin: 1in;
-        }
-        * {
-            hyphens: none !important;
-            -webkit-hyphens: none !important;
-        }
-        body {
-            font-family: Arial, Helvetica, sans-serif;
-            font-size: 11pt;
-            line-height: 1.4;
-        }
-        img {
-            max-width: 100%;
-            height: auto;
-        }
-        a {
-            color: #0066cc;
-        }
-    """, font_config=font_config)
+    return output_path
 
-    html = HTML(string=html_content)
-    html.write_pdf(output_path, stylesheets=[css], font_config=font_config)
 
+def convert_email_to_pdf(
+    email: ParsedEmail,
+    output_dir: Path,
+    *,
+    artifacts: EmailArtifacts | None = None,
+) -> Path | None:
+    """Convert one email to a deduplicated PDF in output_dir.
+
+    Returns the PDF path, or None if conversion failed.
+    """
+    filename = f"{email.logical_filename}.pdf"
+    output_path = deduplicate_path(output_dir / filename)
+
+    try:
+        email_to_pdf(email, output_path, artifacts=artifacts)
+    except Exception as e:
+        logger.error("Failed to convert %s: %s", email.filepath.name, e)
+        return None
+
+    logger.info("Created: %s", output_path.name)
     return output_path
 
 
-def convert_emails_to_pdf(emails: list[ParsedEmail], output_dir: Path) -> list[tuple[ParsedEmail, Path]]:
-    """Convert multiple emails to PDF files."""
+def _init_pdf_worker() -> None:
+    """Process pool initializer: warm up WeasyPrint once per worker.
+
+    The first render in a process pays for Pango/fontconfig setup; doing it
+    here keeps that cost out of the first real job.
+    """
+    from weasyprint import HTML
+
+    font_config, css = get_render_resources()
+    HTML(string="<p></p>").render(stylesheets=[css], font_config=font_config)
+
+
+def _render_pdf(email: ParsedEmail, output_path: Path) -> str | None:
+    """Worker job: render one PDF. Returns an error message on failure."""
+    try:
+        email_to_pdf(email, output_path)
+    except Exception as e:
+        return str(e)
+    return None
+
+
+def create_pdf_pool(workers: int) -> ProcessPoolExecutor:
+    """Create a process pool whose workers are ready to render PDFs."""
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_pdf_worker)
+
+
+def _worker_ready() -> bool:
+    return True
+
+
+def warm_up_pdf_rendering(executor: ProcessPoolExecutor | None = None, workers: int = 1) -> None:
+    """Do WeasyPrint's one-time setup now rather than on the first email.
+
+    Pool workers are started lazily, so one trivial job per worker is
+    submitted to start them (each runs _init_pdf_worker). Without an
+    executor, the current process is warmed up instead.
+    """
+    if executor is None:
+        _init_pdf_worker()
+        return
+    for future in [executor.submit(_worker_ready) for _ in range(workers)]:
+        future.result()
+
+
+def convert_emails_to_pdf(
+    emails: list[ParsedEmail],
+    output_dir: Path,
+    *,
+    workers: int = 1,
+    executor: ProcessPoolExecutor | None = None,
+    artifacts: dict[Path, EmailArtifacts] | None = None,
+) -> list[tuple[ParsedEmail, Path]]:
+    """Convert multiple emails to PDF files.
+
+    With workers > 1 (or an *executor* from create_pdf_pool), PDFs are
+    rendered in parallel. Output names are still assigned up front, in
+    input order, so they match a serial run.
+
+    *artifacts* maps email filepaths to shared EmailArtifacts for serial
+    runs; pool workers derive their own render HTML.
+    """
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    results = []
-    for email in emails:
-        filename = f"{email.logical_filename}.pdf"
-        output_path = deduplicate_path(output_dir / filename)
+    if executor is None and workers <= 1:
+        results = []
+        for email in emails:
+            output_path = convert_email_to_pdf(
+                email, output_dir, artifacts=artifacts.get(email.filepath) if artifacts else None,
+            )
+            if output_path:
+                results.append((email, output_path))
+        return results
+
+    # Files are not on disk until rendered, so track names taken in this batch
+    used_names: set[str] = set()
+    jobs = [
+        (email, deduplicate_path(output_dir / f"{email.logical_filename}.pdf", used_names))
+        for email in emails
+    ]
+
+    with ExitStack() as stack:
+        if executor is None:
+            executor = stack.enter_context(create_pdf_pool(workers))
+        futures = [executor.submit(_render_pdf, email, path) for email, path in jobs]
 
-        try:
-            email_to_pdf(email, output_path)
+        results = []
+        for (email, output_path), future in zip(jobs, futures):
+            error = future.result()
+            if error:
+                logger.error("Failed to convert %s: %s", email.filepath.name, error)
+                continue
             results.append((email, output_path))
             logger.info("Created: %s", output_path.name)
-        except Exception as e:
-            logger.error("Failed to convert %s: %s", email.filepath.name, e)
 
     return results
@@ -0,0 +1,238 @@
+"""Run batches of parsed emails through every output stage."""
+
+import json
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Sequence
+
+from .corpus_stats import CorpusStats
+from .extractor import EmailArtifacts, html_to_text_for_summary
+from .manifest import STAGE_NOTION, STAGE_PDF, STAGE_REPORT, STAGE_RTF, Manifest
+from .notion_export import NotionExporter, prepare_entry
+from .notion_outbox import PENDING, SENT, ExportResult, NotionOutbox, OutboxEntry
+from .parser import ParsedEmail
+from .pdf_converter import convert_emails_to_pdf, warm_up_pdf_rendering
+from .report import ReportEntry, build_report_entry
+from .rtf_converter import convert_emails_to_rtf
+from .summarizer import KeyPointStore, get_engine
+from .utils import deduplicate_path
+
+
+@dataclass
+class EmailPipeline:
+    """Settings, shared resources and running totals for one run.
+
+    Emails flow through every stage in small batches and are then
+    released; only the compact report entries and source paths are kept.
+    Batches let PDFs render in parallel and let pandoc convert several
+    emails per process. PDFs are skipped when *pdf_dir* is None.
+
+    With a *manifest*, each finished stage is recorded per email, and
+    emails already handled by an earlier (possibly interrupted) run only
+    redo the stages they are missing.
+
+    Notion pages are queued in *notion_outbox* and, when Notion is
+    reachable, sent by *notion_exporter* in the background. Without an
+    exporter they wait in the outbox for --notion-drain.
+    """
+    output_dir: Path
+    key_point_store: KeyPointStore
+    sentences: int = 3
+    rtf_backend: str = "native"
+    pdf_dir: Path | None = None
+    pdf_pool: ProcessPoolExecutor | None = None
+    corpus_stats: CorpusStats | None = None
+    notion_outbox: NotionOutbox | None = None
+    notion_exporter: NotionExporter | None = None
+    report_entries: list[ReportEntry] = field(default_factory=list)
+    processed_files: list[Path] = field(default_factory=list)
+    pdf_count: int = 0
+    rtf_count: int = 0
+    notion_count: int = 0
+    used_rtf_names: set[str] = field(default_factory=set)
+    manifest: Manifest | None = None
+    resumed_count: int = 0
+    _exporting: dict[int, ParsedEmail] = field(default_factory=dict, repr=False)  # by outbox entry id
+
+    def _finished_stages(self, email: ParsedEmail) -> dict[str, str]:
+        if self.manifest is None or not email.content_hash:
+            return {}
+        done = self.manifest.completed(email)
+        if STAGE_REPORT in done and self._stored_key_points(done[STAGE_REPORT]) is None:
+            # Summarized with other settings; summarize again
+            del done[STAGE_REPORT]
+        return done
+
+    def _stored_key_points(self, result: str) -> list[str] | None:
+        """Key points from a manifest report result, if made with this run's settings."""
+        try:
+            stored = json.loads(result)
+        except ValueError:
+            return None
+        if (
+            not isinstance(stored, dict)
+            or stored.get("version") != self.key_point_store.settings
+            or stored.get("count") != self.sentences
+        ):
+            return None
+        return stored.get("points")
+
+    def _record(self, email: ParsedEmail, stage: str, result: str) -> None:
+        if self.manifest is not None and email.content_hash:
+            self.manifest.record(email, stage, result)
+
+    def process(self, batch: Sequence[ParsedEmail]) -> None:
+        """Convert, summarize and export one batch of emails.
+
+        Stages the manifest records as finished are skipped, as long as
+        their output file is still in this run's output directory.
+        """
+        finished = {email.filepath: self._finished_stages(email) for email in batch}
+
+        # Render HTML, summary text and key points are derived once per
+        # email and shared by every stage below
+        artifacts = {
+            email.filepath: EmailArtifacts(email, self.key_point_store) for email in batch
+        }
+        if self.corpus_stats is not None:
+            # Count the whole batch's lines before summarizing any of it.
+            # Emails already in the report were counted when they were summarized.
+            for email in batch:
+                if STAGE_REPORT not in finished[email.filepath]:
+                    self.corpus_stats.observe(artifacts[email.filepath].summary_text)
+
+        pdf_paths = {}
+        if self.pdf_dir is not None:
+            pending = []
+            for email in batch:
+                pdf_path = _existing_output(finished[email.filepath], STAGE_PDF, self.pdf_dir)
+                if pdf_path:
+                    pdf_paths[email.filepath] = pdf_path
+                else:
+                    pending.append(email)
+            results = convert_emails_to_pdf(
+                pending, self.pdf_dir, executor=self.pdf_pool, artifacts=artifacts,
+            )
+            for email, pdf_path in results:
+                pdf_paths[email.filepath] = pdf_path
+                self._record(email, STAGE_PDF, str(pdf_path))
+            self.pdf_count += len(results)
+
+        # Convert to RTF (always runs, even with --skip-pdf)
+        pending = [
+            email for email in batch
+            if not _existing_output(finished[email.filepath], STAGE_RTF, self.output_dir)
+        ]
+        rtf_results = convert_emails_to_rtf(
+            pending, self.output_dir, self.rtf_backend,
+            used_names=self.used_rtf_names, artifacts=artifacts,
+        )
+        for email, rtf_path in rtf_results:
+            self._record(email, STAGE_RTF, str(rtf_path))
+        self.rtf_count += len(rtf_results)
+
+        for email in batch:
+            pdf_path = pdf_paths.get(email.filepath)
+            done = finished[email.filepath]
+
+            # Queue for Notion (optional); exports finish in the background
+            if self.notion_outbox is not None and STAGE_NOTION not in done:
+                self._queue_for_notion(email, artifacts[email.filepath], pdf_path)
+
+            if STAGE_REPORT in done:
+                entry = ReportEntry(
+                    subject=email.subject,
+                    sender=email.sender,
+                    date=email.date,
+                    filepath=email.filepath,
+                    key_points=self._stored_key_points(done[STAGE_REPORT]),
+                    pdf_path=pdf_path,
+                )
+            else:
+                email_artifacts = artifacts[email.filepath]
+                entry = build_report_entry(
+                    email, pdf_path, self.sentences, artifacts=email_artifacts,
+                )
+                # Record the settings of the store that made the key points
+                self._record(email, STAGE_REPORT, json.dumps({
+                    "version": email_artifacts.key_point_store.settings,
+                    "count": self.sentences,
+                    "points": entry.key_points,
+                }))
+            self.report_entries.append(entry)
+            self.processed_files.append(email.filepath)
+            self.resumed_count += bool(done)
+
+        if self.notion_exporter:
+            self._record_exports(self.notion_exporter.completed())
+        self._flush()
+
+    def _queue_for_notion(self, email: ParsedEmail, artifacts: EmailArtifacts, pdf_path: Path | None) -> None:
+        queued = self.notion_outbox.add(
+            prepare_entry(email, artifacts.key_points(self.sentences), pdf_path=pdf_path)
+        )
+        if queued.status == SENT:
+            # Sent by an earlier run or by --notion-drain
+            self._record(email, STAGE_NOTION, queued.page_id)
+        elif queued.status == PENDING and self.notion_exporter and queued.id not in self._exporting:
+            self._exporting[queued.id] = email
+            self._record_exports(self.notion_exporter.submit(queued))
+
+    def _record_exports(self, exports: list[tuple[OutboxEntry, ExportResult]]) -> None:
+        for queued, result in exports:
+            self.notion_outbox.record(queued, result)
+            email = self._exporting.pop(queued.id)
+            if result.page_id:
+                self._record(email, STAGE_NOTION, result.page_id)
+                self.notion_count += 1
+
+    def _flush(self) -> None:
+        if self.notion_outbox is not None:
+            self.notion_outbox.flush()
+        if self.manifest is not None:
+            self.manifest.flush()
+
+    def finish(self) -> None:
+        """Wait for Notion exports still in flight and record them."""
+        if self.notion_exporter:
+            self._record_exports(self.notion_exporter.finish())
+        self._flush()
+
+    def warm_up(self, workers: int = 1) -> None:
+        """Load the summarizer and HTML tools and start PDF renderers now.
+
+        For long-running use, so the first email doesn't pay for imports,
+        tokenizer data and font setup.
+        """
+        html_to_text_for_summary("<p></p>")
+        try:
+            get_engine(self.key_point_store.algorithm)
+        except Exception:
+            # Summaries fall back to leading sentences; nothing to warm up
+            pass
+        if self.pdf_dir is not None:
+            warm_up_pdf_rendering(self.pdf_pool, workers)
+
+
+def _existing_output(finished: dict[str, str], stage: str, output_dir: Path) -> Path | None:
+    """Return a stage's recorded output file if it still exists in *output_dir*."""
+    result = finished.get(stage)
+    if not result:
+        return None
+    path = Path(result)
+    if path.parent.resolve() != output_dir.resolve() or not path.exists():
+        return None
+    return path
+
+
+def move_processed_files(files: list[Path], processed_dir: Path) -> list[tuple[Path, Path]]:
+    """Move source files into *processed_dir*, returning (source, destination) pairs."""
+    processed_dir.mkdir(parents=True, exist_ok=True)
+    moved = []
+    for src in files:
+        dst = deduplicate_path(processed_dir / src.name)
+        shutil.move(str(src), str(dst))
+        moved.append((src, dst))
+    return moved
@@ -1,13 +1,12 @@
 """Generate summary report with clickable links to source emails."""
 
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-
-from .extractor import get_text_content
+from .extractor import EmailArtifacts
 from .parser import ParsedEmail
-from .summarizer import extract_key_points
+from .summarizer import KeyPointStore
 from .utils import get_logger, path_to_file_url
 
 logger = get_logger(__name__)
@@ -15,24 +14,54 @@ logger = get_logger(__name__)
 _TEMPLATE_DIR = Path(__file__).parent / "templates"
 
 
-def generate_report(
-    emails: list[ParsedEmail],
-    pdf_paths: dict[Path, Path],
-    output_path: Path,
-    sentences_per_email: int = 3
-) -> Path:
-    """Generate an HTML summary report for the processed emails."""
-    report_data = []
-    for email in sorted(emails, key=lambda e: e.date or datetime.min, reverse=True):
-        text_content = get_text_content(email)
-        key_points = extract_key_points(text_content, sentences_per_email)
+@dataclass
+class ReportEntry:
+    """Compact per-email record for the summary report (no message bodies)."""
+    subject: str
+    sender: str
+    date: datetime | None
+    filepath: Path
+    key_points: list[str]
+    pdf_path: Path | None = None
+
+
+def build_report_entry(
+    email: ParsedEmail,
+    pdf_path: Path | None = None,
+    sentences_per_email: int = 3,
+    *,
+    artifacts: EmailArtifacts | None = None,
+    key_point_store: KeyPointStore | None = None,
+) -> ReportEntry:
+    """Summarize an email into a ReportEntry so its bodies can be released.
+
+    Pass the *key_point_store* used for the Notion export to reuse its key
+    points instead of summarizing again.
+    """
+    artifacts = artifacts or EmailArtifacts(email, key_point_store)
+    key_points = artifacts.key_points(sentences_per_email)
 
-        pdf_path = pdf_paths.get(email.filepath)
+    return ReportEntry(
+        subject=email.subject,
+        sender=email.sender,
+        date=email.date,
+        filepath=email.filepath,
+        key_points=key_points,
+        pdf_path=pdf_path,
+    )
+
+
+def generate_report(entries: list[ReportEntry], output_path: Path) -> Path:
+    """Generate an HTML summary report from per-email report entries."""
+    from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+    report_data = []
+    for entry in sorted(entries, key=lambda e: e.date or datetime.min, reverse=True):
         report_data.append({
-            "email": email,
-            "key_points": key_points,
-            "eml_url": path_to_file_url(email.filepath),
-            "pdf_url": path_to_file_url(pdf_path) if pdf_path else None,
+            "email": entry,
+            "key_points": entry.key_points,
+            "eml_url": path_to_file_url(entry.filepath),
+            "pdf_url": path_to_file_url(entry.pdf_path) if entry.pdf_path else None,
         })
 
     env = Environment(
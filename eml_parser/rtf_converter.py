@@ -1,11 +1,13 @@
-"""Convert emails to RTF format using pypandoc."""
+"""Convert emails to RTF format, natively or using pypandoc."""
 
+import re
 from pathlib import Path
 
-import pypandoc
+import click
 
-from .extractor import get_html_for_pdf
+from .extractor import EmailArtifacts
 from .parser import ParsedEmail
+from .rtf_writer import html_to_rtf
 from .utils import (
     build_email_header_html,
     deduplicate_path,
@@ -15,6 +17,35 @@ from .utils import (
 
 logger = get_logger(__name__)
 
+# "native" writes RTF in-process; "pandoc" shells out for higher fidelity
+RTF_BACKENDS = ("native", "pandoc")
+
+# Emails converted per pandoc process in batch mode
+PANDOC_BATCH_SIZE = 50
+
+# Paragraph text separating emails in a batched pandoc document, and the
+# paragraph group pandoc writes for it: control words only, then the
+# marker. A marker that shares its paragraph with email text or ends up
+# nested in a table (after unbalanced HTML in the email before it) does
+# not match, or is not at the top level, and rejects the batch.
+_SPLIT_MARKER = "EMLPARSERSPLIT"
+_SPLIT_LINE = re.compile(
+    r"\{\\pard(?:\s*\\[a-z]+-?\d*)*\s+" + _SPLIT_MARKER + r"(\d+)X\s*\\par\s*\}"
+)
+_RTF_ESCAPE = re.compile(r"\\[\\{}]")
+_BODY_CONTENT = re.compile(r"<body[^>]*>(.*)</body>", re.IGNORECASE | re.DOTALL)
+
+
+def _require_pypandoc():
+    """Import pypandoc on first use, raising a clear error if it is not installed."""
+    try:
+        import pypandoc
+    except ImportError:
+        raise click.ClickException(
+            "pypandoc is required for the pandoc RTF backend: pip install pypandoc_binary"
+        ) from None
+    return pypandoc
+
 
 def inject_email_header(html_content: str, email: ParsedEmail) -> str:
     """Inject email metadata header into HTML before RTF conversion."""
@@ -24,11 +55,28 @@ def inject_email_header(html_content: str, email: ParsedEmail) -> str:
     return inject_header_into_html(html_content, header_html)
 
 
-def email_to_rtf(email: ParsedEmail, output_path: Path) -> Path:
+def _email_html(email: ParsedEmail, artifacts: EmailArtifacts | None = None) -> str:
+    """Return the email's render HTML with the plain metadata header."""
+    artifacts = artifacts or EmailArtifacts(email)
+    return inject_email_header(artifacts.render_html, email)
+
+
+def email_to_rtf(
+    email: ParsedEmail,
+    output_path: Path,
+    backend: str = "native",
+    *,
+    artifacts: EmailArtifacts | None = None,
+) -> Path:
     """Convert a single ParsedEmail to RTF format."""
-    html_content = get_html_for_pdf(email)
-    html_with_header = inject_email_header(html_content, email)
+    html_with_header = _email_html(email, artifacts)
+
+    if backend == "native":
+        # Non-ASCII text is escaped by the writer, so the output is plain ASCII
+        output_path.write_text(html_to_rtf(html_with_header), encoding="ascii")
+        return output_path
 
+    pypandoc = _require_pypandoc()
     pypandoc.convert_text(
         html_with_header,
         'rtf',
@@ -40,23 +88,159 @@ def email_to_rtf(email: ParsedEmail, output_path: Path) -> Path:
     return output_path
 
 
+def convert_email_to_rtf(
+    email: ParsedEmail,
+    output_dir: Path,
+    used_names: set[str],
+    backend: str = "native",
+    *,
+    artifacts: EmailArtifacts | None = None,
+) -> Path | None:
+    """Convert one email to a deduplicated RTF in output_dir.
+
+    *used_names* tracks names taken earlier in the batch. Returns the RTF
+    path, or None if conversion failed.
+    """
+    try:
+        base_name = email.filename_safe_subject
+        output_path = deduplicate_path(output_dir / f"{base_name}.rtf", used_names)
+        email_to_rtf(email, output_path, backend, artifacts=artifacts)
+    except click.ClickException:
+        raise
+    except Exception as e:
+        logger.warning("RTF conversion failed for '%s': %s", email.subject, e)
+        return None
+
+    logger.info("RTF: %s", output_path.name)
+    return output_path
+
+
+def _body_html(html_content: str) -> str:
+    """Return the contents of <body>, or the whole document if there is none."""
+    match = _BODY_CONTENT.search(html_content)
+    return match.group(1) if match else html_content
+
+
+def pandoc_batch_to_rtf(html_docs: list[str]) -> list[str]:
+    """Convert several HTML documents to standalone RTF with one pandoc run.
+
+    The bodies are joined with numbered marker paragraphs, converted
+    together, and the output is split back apart at the markers. Each part
+    gets pandoc's standalone RTF prologue. Raises ValueError unless every
+    marker comes out as its own paragraph at the top level of the document,
+    in order, so one email's unclosed markup can't shift content into
+    another.
+    """
+    pypandoc = _require_pypandoc()
+    combined = "".join(
+        f"<p>{_SPLIT_MARKER}{i}X</p>\n{_body_html(doc)}\n"
+        for i, doc in enumerate(html_docs)
+    )
+    output = pypandoc.convert_text(
+        f"<html><body>{combined}</body></html>",
+        'rtf',
+        format='html',
+        extra_args=['--standalone'],
+    )
+
+    lines = output.splitlines(keepends=True)
+    marker_lines = []
+    numbers = []
+    depth = 0  # RTF group nesting before each line; 1 is the document body
+    for i, line in enumerate(lines):
+        if _SPLIT_MARKER in line:
+            match = _SPLIT_LINE.fullmatch(line.strip())
+            marker_lines.append(i)
+            numbers.append(match.group(1) if match and depth == 1 else None)
+        unescaped = _RTF_ESCAPE.sub("", line)
+        depth += unescaped.count("{") - unescaped.count("}")
+    expected = [str(i) for i in range(len(html_docs))]
+    if numbers != expected:
+        bad = next((i for i, number in enumerate(numbers) if number != str(i)), len(numbers))
+        raise ValueError(f"pandoc output could not be split at the marker for document {bad}")
+
+    prologue = "".join(lines[:marker_lines[0]])
+    bounds = marker_lines + [len(lines)]
+    parts = []
+    for start, end in zip(bounds, bounds[1:]):
+        parts.append("".join(lines[start + 1:end]))
+
+    # The last part carries the closing brace of the combined document
+    parts[-1] = parts[-1].rstrip().removesuffix("}") + "\n"
+    return [f"{prologue}{part}}}\n" for part in parts]
+
+
+def _convert_batch_with_pandoc(
+    jobs: list[tuple[ParsedEmail, Path]],
+    artifacts: dict[Path, EmailArtifacts],
+) -> list[tuple[ParsedEmail, Path]]:
+    """Convert emails in pandoc batches, falling back to one run per email."""
+    results = []
+    for start in range(0, len(jobs), PANDOC_BATCH_SIZE):
+        chunk = jobs[start:start + PANDOC_BATCH_SIZE]
+        try:
+            documents = pandoc_batch_to_rtf([
+                _email_html(email, artifacts.get(email.filepath)) for email, _ in chunk
+            ])
+        except click.ClickException:
+            raise
+        except Exception as e:
+            logger.warning(
+                "Batched pandoc conversion failed (%s); converting %d email(s) with one "
+                "pandoc run each, which is much slower",
+                e, len(chunk),
+            )
+            documents = None
+
+        for i, (email, output_path) in enumerate(chunk):
+            try:
+                if documents is None:
+                    email_to_rtf(email, output_path, "pandoc", artifacts=artifacts.get(email.filepath))
+                else:
+                    output_path.write_text(documents[i], encoding="utf-8")
+            except Exception as e:
+                logger.warning("RTF conversion failed for '%s': %s", email.subject, e)
+                continue
+            results.append((email, output_path))
+            logger.info("RTF: %s", output_path.name)
+
+    return results
+
+
 def convert_emails_to_rtf(
     emails: list[ParsedEmail],
-    output_dir: Path
+    output_dir: Path,
+    backend: str = "native",
+    *,
+    used_names: set[str] | None = None,
+    artifacts: dict[Path, EmailArtifacts] | None = None,
 ) -> list[tuple[ParsedEmail, Path]]:
-    """Convert multiple emails to RTF, handling duplicates and errors."""
+    """Convert multiple emails to RTF, handling duplicates and errors.
+
+    With the pandoc backend, emails are converted PANDOC_BATCH_SIZE at a
+    time to avoid starting pandoc once per email. Pass *used_names* to keep
+    names unique across several calls. *artifacts* maps email filepaths to
+    shared EmailArtifacts.
+    """
     output_dir.mkdir(parents=True, exist_ok=True)
-    results = []
-    used_names: set[str] = set()
+    if used_names is None:
+        used_names = set()
+    if artifacts is None:
+        artifacts = {}
 
+    if backend == "pandoc":
+        jobs = [
+            (email, deduplicate_path(output_dir / f"{email.filename_safe_subject}.rtf", used_names))
+            for email in emails
+        ]
+        return _convert_batch_with_pandoc(jobs, artifacts)
+
+    results = []
     for email in emails:
-        try:
-            base_name = email.filename_safe_subject
-            output_path = deduplicate_path(output_dir / f"{base_name}.rtf", used_names)
-            email_to_rtf(email, output_path)
+        output_path = convert_email_to_rtf(
+            email, output_dir, used_names, backend, artifacts=artifacts.get(email.filepath),
+        )
+        if output_path:
             results.append((email, output_path))
-            logger.info("RTF: %s", output_path.name)
-        except Exception as e:
-            logger.warning("RTF conversion failed for '%s': %s", email.subject, e)
 
     return results
@@ -0,0 +1,256 @@
+"""Write RTF directly from email HTML without an external converter."""
+
+import re
+from html.parser import HTMLParser
+
+# Elements whose content is never rendered
+_SKIP_TAGS = {"script", "style", "head", "title", "noscript"}
+
+# Elements that start and end a paragraph
+_BLOCK_TAGS = {
+    "p", "div", "section", "article", "header", "footer", "main", "aside",
+    "center", "address", "figure", "figcaption", "dl", "dt", "dd",
+    "table", "thead", "tbody", "tfoot", "ul", "ol", "blockquote", "pre",
+    "h1", "h2", "h3", "h4", "h5", "h6",
+}
+
+# Inline formatting: tag -> RTF control words opened in a group
+_INLINE_FORMATS = {
+    "b": r"\b",
+    "strong": r"\b",
+    "i": r"\i",
+    "em": r"\i",
+    "u": r"\ul",
+    "s": r"\strike",
+    "strike": r"\strike",
+    "del": r"\strike",
+    "code": r"\f1",
+    "sup": r"\super",
+    "sub": r"\sub",
+}
+
+# Headings are bold at these half-point sizes
+_HEADING_SIZES = {"h1": 36, "h2": 32, "h3": 28, "h4": 24, "h5": 24, "h6": 24}
+
+# Left indent per list or blockquote level, in twips
+_INDENT_STEP = 360
+
+_RTF_PROLOGUE = (
+    r"{\rtf1\ansi\ansicpg1252\deff0"
+    r"{\fonttbl{\f0\fswiss Arial;}{\f1\fmodern Courier New;}}"
+    r"{\colortbl;\red0\green102\blue204;}"
+    "\n"
+    r"\f0\fs22 "
+)
+
+_WHITESPACE = re.compile(r"\s+")
+_RTF_SPECIAL = re.compile(r"[\\{}\t\x80-\U0010ffff]")
+
+
+def _escape_char(match: re.Match) -> str:
+    char = match.group()
+    if char in "\\{}":
+        return "\\" + char
+    if char == "\t":
+        return r"\tab "
+    code = ord(char)
+    if code > 0xFFFF:
+        # RTF \u takes UTF-16 code units, so astral characters need a surrogate pair
+        code -= 0x10000
+        high = 0xD800 + (code >> 10)
+        low = 0xDC00 + (code & 0x3FF)
+        return rf"\u{high - 0x10000}?\u{low - 0x10000}?"
+    # \u takes a signed 16-bit value
+    return rf"\u{code if code < 0x8000 else code - 0x10000}?"
+
+
+def escape_rtf(text: str) -> str:
+    """Escape text for inclusion in an RTF document."""
+    return _RTF_SPECIAL.sub(_escape_char, text)
+
+
+class _RtfBuilder(HTMLParser):
+    """HTMLParser that emits RTF as it walks the document."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.out: list[str] = []
+        self.skip_depth = 0
+        self.pre_depth = 0
+        self.quote_depth = 0
+        self.lists: list[list] = []  # [tag, next_number] per open list
+        self.inline_stack: list[str] = []  # open inline tags, each with one RTF group
+        self.para_open = False
+        self.line_has_text = False
+        self.pending_space = False
+        self.pending_bullet = ""
+        self.cell_index = 0
+
+    # --- Paragraph handling ---
+
+    def _block_break(self) -> None:
+        if self.line_has_text:
+            self.out.append("\\par\n")
+        self.para_open = False
+        self.line_has_text = False
+        self.pending_space = False
+
+    def _ensure_paragraph(self) -> None:
+        if self.para_open:
+            return
+        indent = _INDENT_STEP * (len(self.lists) + self.quote_depth)
+        if self.pending_bullet:
+            # Hanging indent so wrapped lines align with the item text
+            self.out.append(rf"\pard\sa120\li{indent}\fi-{_INDENT_STEP} ")
+            self.out.append(escape_rtf(self.pending_bullet) + r"\tab ")
+            self.pending_bullet = ""
+            self.line_has_text = True
+        else:
+            self.out.append(rf"\pard\sa120\li{indent} ")
+        self.para_open = True
+
+    def _open_group(self, tag: str, controls: str) -> None:
+        self._ensure_paragraph()
+        self.out.append("{" + controls + " ")
+        self.inline_stack.append(tag)
+
+    def _close_group(self, tag: str) -> None:
+        if tag not in self.inline_stack:
+            return
+        # Close any unclosed inner tags too, keeping RTF groups balanced
+        while self.inline_stack:
+            open_tag = self.inline_stack.pop()
+            self.out.append("}}}" if open_tag == "a" else "}")
+            if open_tag == tag:
+                break
+
+    # --- HTMLParser callbacks ---
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIP_TAGS:
+            self.skip_depth += 1
+            return
+        if self.skip_depth:
+            return
+
+        if tag in _BLOCK_TAGS:
+            self._block_break()
+            if tag in ("ul", "ol"):
+                self.lists.append([tag, 1])
+            elif tag == "blockquote":
+                self.quote_depth += 1
+            elif tag == "pre":
+                self.pre_depth += 1
+                self._open_group(tag, r"\f1")
+            elif tag in _HEADING_SIZES:
+                self._open_group(tag, rf"\b\fs{_HEADING_SIZES[tag]}")
+        elif tag == "li":
+            self._block_break()
+            if self.lists and self.lists[-1][0] == "ol":
+                self.pending_bullet = f"{self.lists[-1][1]}."
+                self.lists[-1][1] += 1
+            else:
+                self.pending_bullet = "\u2022"
+        elif tag == "tr":
+            self._block_break()
+            self.cell_index = 0
+        elif tag in ("td", "th"):
+            if self.cell_index:
+                self._ensure_paragraph()
+                self.out.append(r"\tab ")
+                self.pending_space = False
+            self.cell_index += 1
+            if tag == "th":
+                self._open_group(tag, r"\b")
+        elif tag == "br":
+            self._ensure_paragraph()
+            self.out.append("\\line\n")
+            self.line_has_text = True
+            self.pending_space = False
+        elif tag == "hr":
+            self._block_break()
+            self.out.append("\\pard\\brdrb\\brdrs\\brdrw10\\brsp20 \\par\n")
+        elif tag == "a":
+            href = dict(attrs).get("href") or ""
+            if href.startswith(("http://", "https://", "mailto:")):
+                self._ensure_paragraph()
+                if self.pending_space:
+                    self.out.append(" ")
+                    self.pending_space = False
+                self.out.append(
+                    r'{\field{\*\fldinst{HYPERLINK "' + escape_rtf(href) + r'"}}{\fldrslt{\ul\cf1 '
+                )
+                self.inline_stack.append("a")
+        elif tag in _INLINE_FORMATS:
+            self._open_group(tag, _INLINE_FORMATS[tag])
+
+    def handle_endtag(self, tag):
+        if tag in _SKIP_TAGS:
+            self.skip_depth = max(0, self.skip_depth - 1)
+            return
+        if self.skip_depth:
+            return
+
+        if tag in _BLOCK_TAGS:
+            if tag == "pre" or tag in _HEADING_SIZES:
+                self._close_group(tag)
+            if tag in ("ul", "ol") and self.lists:
+                self.lists.pop()
+            elif tag == "blockquote":
+                self.quote_depth = max(0, self.quote_depth - 1)
+            elif tag == "pre":
+                self.pre_depth = max(0, self.pre_depth - 1)
+            self._block_break()
+        elif tag in ("li", "tr"):
+            self._block_break()
+        elif tag in ("a", "th") or tag in _INLINE_FORMATS:
+            self._close_group(tag)
+
+    def handle_data(self, data):
+        if self.skip_depth or not data:
+            return
+
+        if self.pre_depth:
+            self._ensure_paragraph()
+            lines = data.split("\n")
+            for i, line in enumerate(lines):
+                if i:
+                    self.out.append("\\line\n")
+                self.out.append(escape_rtf(line))
+            self.line_has_text = True
+            return
+
+        text = _WHITESPACE.sub(" ", data)
+        if text == " ":
+            self.pending_space = self.line_has_text
+            return
+
+        leading = text.startswith(" ")
+        trailing = text.endswith(" ")
+        text = text.strip()
+
+        self._ensure_paragraph()
+        if (leading or self.pending_space) and self.line_has_text:
+            self.out.append(" ")
+        self.out.append(escape_rtf(text))
+        self.line_has_text = True
+        self.pending_space = trailing
+
+    def finish(self) -> str:
+        self.close()
+        if self.inline_stack:
+            self._close_group(self.inline_stack[0])
+        self._block_break()
+        return _RTF_PROLOGUE + "".join(self.out) + "}\n"
+
+
+def html_to_rtf(html_content: str) -> str:
+    """Convert HTML to a standalone RTF document.
+
+    Handles paragraphs, headings, lists, links, bold/italic/underline,
+    preformatted text and tables (one paragraph per row, tab-separated
+    cells). CSS, images and layout are ignored.
+    """
+    builder = _RtfBuilder()
+    builder.feed(html_content)
+    return builder.finish()
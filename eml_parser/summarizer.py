@@ -1,31 +1,112 @@
 """Extract key points from email content using extractive summarization."""
 
 import re
+from functools import lru_cache
+from itertools import chain
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable
 
-from sumy.nlp.stemmers import Stemmer
-from sumy.nlp.tokenizers import Tokenizer
-from sumy.parsers.plaintext import PlaintextParser
-from sumy.summarizers.lsa import LsaSummarizer
-from sumy.utils import get_stop_words
+# numpy and sumy are imported on first use
+if TYPE_CHECKING:
+    import numpy
+    from sumy.models.dom import ObjectDocumentModel
+
+    from .corpus_stats import CorpusStats
+    from .summary_cache import SummaryCache
 
 LANGUAGE = "english"
 SENTENCES_COUNT = 3
 
-# Patterns that contain periods but shouldn't be split as sentences
-PROTECTED_PATTERNS = [
-    (r'v(\d+)\.(\d+)\.(\d+)', r'v\1_DOT_\2_DOT_\3'),  # Version numbers: v0.52.40
-    (r'(\d+)\.(\d+)\.(\d+)', r'\1_DOT_\2_DOT_\3'),     # Version numbers: 0.52.40
-    (r'(\d+)\.(\d+)', r'\1_DOT_\2'),                   # Decimal numbers: 3.14
-    (r'([A-Za-z])\.([A-Za-z])\.', r'\1_DOT_\2_DOT_'),  # Initials: U.S., e.g.
-    (r'\.\.\.', '_ELLIPSIS_'),                         # Ellipsis
-]
+# Algorithm used when none is chosen (see SUMMARIZERS)
+DEFAULT_SUMMARIZER = "lsa"
+
+# Part of the summary cache key, together with the algorithm name: bump
+# whenever any engine's output changes
+SUMMARIZER_VERSION = "3"
+
+# Bounded LSA: longer texts are truncated, and documents with more sentences
+# are summarized in windows so no SVD runs over more than MAX_LSA_SENTENCES
+MAX_SUMMARY_CHARS = 100_000
+MAX_LSA_SENTENCES = 300
+MAX_LSA_WINDOWS = 8
+
+# LsaSummarizer's term-frequency smoothing factor
+LSA_SMOOTHING = 0.4
+
+# Distinct words whose stems are cached by the NumPy engines
+STEM_CACHE_SIZE = 100_000
+
+# Sentence ranks closer than this are treated as ties
+RANK_DECIMALS = 9
+
+# TextRank: PageRank damping factor and power-iteration limits
+TEXTRANK_DAMPING = 0.85
+TEXTRANK_MAX_ITERATIONS = 100
+TEXTRANK_TOLERANCE = 1e-6
+
+# The lead extractor only tokenizes the start of each text
+LEAD_MAX_CHARS = 5_000
+
+# Periods that shouldn't split sentences, found in one scan that only stops
+# at periods:
+#   version numbers and decimals  v0.52.40, 0.52.40, 3.14  -> _DOT_
+#   initials                      U.S., e.g.               -> _DOT_
+#   ellipsis                      ...                      -> _ELLIPSIS_
+# Digit runs match from their second group on; the first is found by
+# looking back from the match.
+_PROTECTED_PERIODS = re.compile(
+    r"\.(?:(?<=\d\.)(\d+(?:\.\d+)*)|(?<=[A-Za-z]\.)([A-Za-z])\.|\.\.)"
+)
+
+
+def _protect_number(run: str, after_v: bool) -> str:
+    """Protect the periods of a run of dot-separated digit groups.
+
+    Returns the run from its first separator on, since the match leaves
+    the first group in place. Groups are joined in threes
+    (version numbers, first after a "v"), then in pairs (decimals), scanning
+    left to right. Runs of five or more groups can keep a plain period,
+    e.g. 1.2.3.4.5 -> 1_DOT_2_DOT_3_DOT_4.5; the summary cache relies on
+    this output staying the same.
+    """
+    groups = run.split(".")
+    protected = [False] * (len(groups) - 1)  # per separator
+    if after_v and len(groups) >= 3:
+        protected[0] = protected[1] = True
+    for width in (2, 1):
+        i = 0
+        while i + width <= len(protected):
+            if any(protected[i:i + width]):
+                i += 1
+            else:
+                protected[i:i + width] = [True] * width
+                i += width + 1
+    return "".join(
+        ("_DOT_" if is_protected else ".") + group
+        for is_protected, group in zip(protected, groups[1:])
+    )
+
+
+def _protect_match(match: re.Match) -> str:
+    rest = match.group(1)
+    if rest is not None:
+        if "." not in rest:
+            # Decimal: the common case, with nothing else to consider
+            return "_DOT_" + rest
+        text = match.string
+        start = first = match.start()
+        while first and text[first - 1].isdecimal():
+            first -= 1
+        after_v = first > 0 and text[first - 1] == "v"
+        return _protect_number(text[first:start] + match.group(), after_v)
+    if match.group(2) is not None:
+        return "_DOT_" + match.group(2) + "_DOT_"
+    return "_ELLIPSIS_"
 
 
 def _protect_periods(text: str) -> str:
-    """Replace periods in version numbers and decimals with placeholders."""
-    for pattern, replacement in PROTECTED_PATTERNS:
-        text = re.sub(pattern, replacement, text)
-    return text
+    """Replace periods in version numbers, decimals, initials and ellipses with placeholders."""
+    return _PROTECTED_PERIODS.sub(_protect_match, text)
 
 
 def _restore_periods(text: str) -> str:
@@ -33,28 +114,361 @@ def _restore_periods(text: str) -> str:
     return text.replace('_DOT_', '.').replace('_ELLIPSIS_', '...')
 
 
-def extract_key_points(text: str, sentence_count: int = SENTENCES_COUNT) -> list[str]:
-    """Extract key sentences from text using LSA summarization."""
+def _first_sentences(text: str, sentence_count: int) -> list[str]:
+    """Fallback summary: the first few period-separated sentences."""
+    sentences = text.split(".")[:sentence_count]
+    return [s.strip() + "." for s in sentences if s.strip()]
+
+
+def _document_of(sentences) -> "ObjectDocumentModel":
+    """Wrap a sequence of sumy sentences in a single-paragraph document."""
+    from sumy.models.dom import ObjectDocumentModel, Paragraph
+
+    return ObjectDocumentModel([Paragraph(sentences)])
+
+
+class SummarizerEngine:
+    """Long-lived LSA summarizer.
+
+    The tokenizer, stemmer, stop words and LsaSummarizer are built once and
+    reused for every text, instead of on each extract_key_points call.
+
+    Cost is bounded for very long texts: input beyond *max_chars* is
+    dropped, and documents with more than *max_sentences* sentences are
+    summarized in two stages (see _bounded_document). Pass None to disable
+    either limit.
+    """
+
+    def __init__(
+        self,
+        language: str = LANGUAGE,
+        *,
+        max_chars: int | None = MAX_SUMMARY_CHARS,
+        max_sentences: int | None = MAX_LSA_SENTENCES,
+    ):
+        self.language = language
+        self.max_chars = max_chars
+        self.max_sentences = max_sentences
+        from sumy.nlp.stemmers import Stemmer
+        from sumy.nlp.tokenizers import Tokenizer
+        from sumy.summarizers.lsa import LsaSummarizer
+        from sumy.utils import get_stop_words
+
+        self.tokenizer = Tokenizer(language)
+        self.summarizer = LsaSummarizer(Stemmer(language))
+        self.summarizer.stop_words = get_stop_words(language)
+
+    def _bounded_document(self, document, sentence_count: int):
+        """Reduce a long document to at most max_sentences candidate sentences.
+
+        The sentences are split into windows of max_sentences. If there are
+        more than MAX_LSA_WINDOWS windows, an evenly spaced subset is used.
+        Each window is summarized on its own, and the winners (in document
+        order) form the document for the final pass. Every SVD is therefore
+        over at most max_sentences sentences, and there are at most
+        MAX_LSA_WINDOWS + 1 of them.
+        """
+        sentences = document.sentences
+        size = self.max_sentences
+        if size is None or len(sentences) <= size:
+            return document
+
+        windows = [sentences[i:i + size] for i in range(0, len(sentences), size)]
+        if len(windows) > MAX_LSA_WINDOWS:
+            step = len(windows) / MAX_LSA_WINDOWS
+            windows = [windows[int(i * step)] for i in range(MAX_LSA_WINDOWS)]
+
+        per_window = max(sentence_count, size // len(windows))
+        candidates = []
+        for window in windows:
+            candidates.extend(self._select(_document_of(window), per_window))
+        return _document_of(candidates)
+
+    def _select(self, document, sentence_count: int) -> tuple:
+        """Return the best sentences of a sumy document, in document order."""
+        return self.summarizer(document, sentence_count)
+
+    def summarize(self, text: str, sentence_count: int = SENTENCES_COUNT) -> list[str]:
+        """Extract key sentences from text."""
+        if not text or len(text.strip()) < 100:
+            # Text too short to summarize meaningfully
+            return [text.strip()] if text.strip() else []
+
+        if self.max_chars is not None:
+            text = text[:self.max_chars]
+
+        # Protect version numbers and decimals from being split as sentences
+        protected_text = _protect_periods(text)
+
+        from sumy.parsers.plaintext import PlaintextParser
+
+        try:
+            parser = PlaintextParser.from_string(protected_text, self.tokenizer)
+            document = self._bounded_document(parser.document, sentence_count)
+            summary = self._select(document, sentence_count)
+            # Restore protected periods in the output
+            return [_restore_periods(str(sentence)) for sentence in summary]
+        except Exception:
+            return _first_sentences(text, sentence_count)
+
+    def summarize_many(self, texts: list[str], sentence_count: int = SENTENCES_COUNT) -> list[list[str]]:
+        """Summarize several texts, returning one key-point list per text."""
+        return [self.summarize(text, sentence_count) for text in texts]
+
+
+class _NumpyEngine(SummarizerEngine):
+    """Base for engines that score a term-sentence matrix with NumPy.
+
+    Stems are cached across the whole batch, and each sentence is
+    tokenized into words once.
+    """
+
+    def __init__(self, language: str = LANGUAGE, **kwargs):
+        super().__init__(language, **kwargs)
+        self._stem = lru_cache(maxsize=STEM_CACHE_SIZE)(self.summarizer.stem_word)
+
+    def _term_counts(self, document) -> "numpy.ndarray | None":
+        """Count each non-stop-word stem per sentence, as LsaSummarizer does.
+
+        Returns a (terms x sentences) matrix, or None if the document has
+        no countable words. Heading words add rows but no counts.
+        """
+        import numpy
+
+        stop_words = self.summarizer.stop_words
+        stem = self._stem
+
+        sentence_words = [sentence.words for sentence in document.sentences]
+        heading_words = [heading.words for heading in document.headings]
+
+        dictionary: dict[str, int] = {}
+        for words in chain(sentence_words, heading_words):
+            for word in words:
+                if word.lower() not in stop_words:
+                    dictionary.setdefault(stem(word), len(dictionary))
+        if not dictionary:
+            return None
+
+        rows = []
+        cols = []
+        for col, words in enumerate(sentence_words):
+            for word in words:
+                row = dictionary.get(stem(word))
+                if row is not None:
+                    rows.append(row)
+                    cols.append(col)
+
+        matrix = numpy.zeros((len(dictionary), len(sentence_words)))
+        numpy.add.at(matrix, (rows, cols), 1)
+        return matrix
+
+    @staticmethod
+    def _best(sentences, scores: "numpy.ndarray", sentence_count: int) -> tuple:
+        """Pick the highest-scoring sentences, returned in document order."""
+        import numpy
+
+        scores = numpy.round(scores, RANK_DECIMALS)
+        # Stable descending sort breaks ties by document order
+        best = sorted(range(len(sentences)), key=scores.__getitem__, reverse=True)[:sentence_count]
+        return tuple(sentences[i] for i in sorted(best))
+
+
+class VectorizedLsaEngine(_NumpyEngine):
+    """SummarizerEngine that does sumy's LSA arithmetic with NumPy.
+
+    It computes the same ranks as LsaSummarizer, but the term-sentence
+    matrix is filled from index arrays and the term-frequency smoothing and
+    ranking are vector operations instead of per-cell Python loops.
+
+    Ranks are rounded to RANK_DECIMALS places, so sentences that tie go to
+    the earlier one. sumy's choice among tied sentences depends on set
+    iteration order and can change between runs.
+    """
+
+    def _select(self, document, sentence_count: int) -> tuple:
+        import numpy
+
+        matrix = self._term_counts(document)
+        if matrix is None:
+            return ()
+
+        # Max-TF normalization with smoothing, as in LsaSummarizer; note that
+        # zero cells of non-empty sentences also become LSA_SMOOTHING
+        max_frequencies = matrix.max(axis=0)
+        nonzero = max_frequencies != 0
+        matrix[:, nonzero] = LSA_SMOOTHING + (1.0 - LSA_SMOOTHING) * (
+            matrix[:, nonzero] / max_frequencies[nonzero]
+        )
+
+        _u, sigma, v = numpy.linalg.svd(matrix, full_matrices=False)
+
+        # rank = sqrt(sum_i sigma_i^2 * v_i^2) over LsaSummarizer's kept dimensions
+        lsa = self.summarizer
+        dimensions = max(lsa.MIN_DIMENSIONS, int(len(sigma) * lsa.REDUCTION_RATIO))
+        powered_sigma = sigma[:dimensions, None] ** 2
+        ranks = numpy.sqrt((powered_sigma * v[:dimensions] ** 2).sum(axis=0))
+        return self._best(document.sentences, ranks, sentence_count)
+
+
+class TextRankEngine(_NumpyEngine):
+    """TextRank over TF-IDF sentence vectors.
+
+    Sentences are linked by the cosine similarity of their TF-IDF vectors
+    and ranked with PageRank. There is no SVD, so it is cheaper than LSA on
+    long documents; the similarity matrix is bounded by max_sentences.
+    """
+
+    def _select(self, document, sentence_count: int) -> tuple:
+        import numpy
+
+        counts = self._term_counts(document)
+        if counts is None:
+            return ()
+
+        sentences = document.sentences
+        size = len(sentences)
+
+        # Smoothed IDF, so heading-only terms (df = 0) stay finite
+        document_frequencies = (counts > 0).sum(axis=1)
+        idf = numpy.log((1 + size) / (1 + document_frequencies)) + 1.0
+        vectors = counts * idf[:, None]
+        norms = numpy.linalg.norm(vectors, axis=0)
+        norms[norms == 0] = 1.0
+        vectors /= norms
+
+        similarity = vectors.T @ vectors
+        numpy.fill_diagonal(similarity, 0.0)
+
+        # Row-stochastic transitions; sentences sharing no terms link to all
+        out_weights = similarity.sum(axis=1, keepdims=True)
+        transitions = numpy.divide(
+            similarity, out_weights,
+            out=numpy.full_like(similarity, 1.0 / size),
+            where=out_weights != 0,
+        )
+
+        scores = numpy.full(size, 1.0 / size)
+        for _ in range(TEXTRANK_MAX_ITERATIONS):
+            updated = (1 - TEXTRANK_DAMPING) / size + TEXTRANK_DAMPING * (transitions.T @ scores)
+            converged = numpy.abs(updated - scores).sum() < TEXTRANK_TOLERANCE
+            scores = updated
+            if converged:
+                break
+
+        return self._best(sentences, scores, sentence_count)
+
+
+class LeadEngine(SummarizerEngine):
+    """Position-based extractor: the first sentences of the text.
+
+    Only the first LEAD_MAX_CHARS characters are tokenized and no words are
+    scored, so it is the fastest engine. Suits newsletters and notices that
+    put the point up front.
+    """
+
+    def __init__(
+        self,
+        language: str = LANGUAGE,
+        *,
+        max_chars: int | None = LEAD_MAX_CHARS,
+        max_sentences: int | None = None,
+    ):
+        super().__init__(language, max_chars=max_chars, max_sentences=max_sentences)
+
+    def _select(self, document, sentence_count: int) -> tuple:
+        return tuple(document.sentences[:sentence_count])
+
+
+# Engines selectable with --summarizer, by name
+SUMMARIZERS: dict[str, type[SummarizerEngine]] = {
+    "lsa": VectorizedLsaEngine,
+    "textrank": TextRankEngine,
+    "lead": LeadEngine,
+}
+
+
+@lru_cache(maxsize=None)
+def get_engine(algorithm: str = DEFAULT_SUMMARIZER, language: str = LANGUAGE) -> SummarizerEngine:
+    """Return this process's shared engine for *algorithm*."""
+    return SUMMARIZERS[algorithm](language)
+
+
+def extract_key_points(
+    text: str,
+    sentence_count: int = SENTENCES_COUNT,
+    algorithm: str = DEFAULT_SUMMARIZER,
+) -> list[str]:
+    """Extract key sentences from text with the chosen algorithm (LSA by default)."""
     if not text or len(text.strip()) < 100:
         # Text too short to summarize meaningfully
         return [text.strip()] if text.strip() else []
 
-    # Protect version numbers and decimals from being split as sentences
-    protected_text = _protect_periods(text)
-
     try:
-        parser = PlaintextParser.from_string(protected_text, Tokenizer(LANGUAGE))
-        stemmer = Stemmer(LANGUAGE)
-        summarizer = LsaSummarizer(stemmer)
-        summarizer.stop_words = get_stop_words(LANGUAGE)
-
-        summary = summarizer(parser.document, sentence_count)
-        # Restore protected periods in the output
-        return [_restore_periods(str(sentence)) for sentence in summary]
+        engine = get_engine(algorithm)
     except Exception:
-        # Fallback: return first few sentences
-        sentences = text.split(".")[:sentence_count]
-        return [s.strip() + "." for s in sentences if s.strip()]
+        # Tokenizer data unavailable (e.g. NLTK punkt not downloaded)
+        return _first_sentences(text, sentence_count)
+
+    return engine.summarize(text, sentence_count)
+
+
+class KeyPointStore:
+    """Key points per email for one run, so each email is summarized once.
+
+    Entries are keyed by email filepath and sentence count. The report and
+    the Notion exporter read from the same store. With a *cache*, misses are
+    looked up on disk by content hash before summarizing. *algorithm* names
+    an engine in SUMMARIZERS. With *corpus_stats*, lines seen in many other
+    emails are dropped first (and the cache is keyed by the remaining text).
+    """
+
+    def __init__(
+        self,
+        cache: "SummaryCache | None" = None,
+        algorithm: str = DEFAULT_SUMMARIZER,
+        corpus_stats: "CorpusStats | None" = None,
+    ):
+        self.cache = cache
+        self.algorithm = algorithm
+        self.corpus_stats = corpus_stats
+        self._version = f"{algorithm}-{SUMMARIZER_VERSION}"
+        self._points: dict[tuple[Path, int], list[str]] = {}
+
+    def get(self, filepath: Path, sentence_count: int, text: Callable[[], str]) -> list[str]:
+        """Return key points for an email, calling *text* only on a miss."""
+        key = (filepath, sentence_count)
+        if key not in self._points:
+            self._points[key] = self._summarize(text(), sentence_count)
+        return self._points[key]
+
+    def _summarize(self, text: str, sentence_count: int) -> list[str]:
+        if self.corpus_stats is not None:
+            text = self.corpus_stats.strip_boilerplate(text)
+
+        if self.cache is None:
+            return extract_key_points(text, sentence_count, self.algorithm)
+
+        key_points = self.cache.get(text, sentence_count, self._version)
+        if key_points is None:
+            key_points = extract_key_points(text, sentence_count, self.algorithm)
+            self.cache.put(text, sentence_count, self._version, key_points)
+        return key_points
+
+    @property
+    def settings(self) -> str:
+        """Identify the engine, its version and boilerplate filtering.
+
+        Key points stored outside this store (the manifest) are only reused
+        while this matches.
+        """
+        return self._version + ("+corpus" if self.corpus_stats is not None else "")
+
+    def clear(self) -> None:
+        """Forget this run's key points (the disk cache is unaffected)."""
+        self._points.clear()
+
+    def __len__(self) -> int:
+        return len(self._points)
 
 
 def summarize_email(text: str, max_sentences: int = 3) -> str:
@@ -0,0 +1,108 @@
+"""Persistent cache of extracted key points, keyed by content hash."""
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+from .utils import get_logger
+
+logger = get_logger(__name__)
+
+# Entries kept before least-recently-used ones are evicted
+DEFAULT_MAX_ENTRIES = 100_000
+
+# Writes between commits (and eviction checks)
+_COMMIT_INTERVAL = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS summaries (
+    key TEXT PRIMARY KEY,
+    key_points TEXT NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS summaries_last_used ON summaries (last_used);
+"""
+
+
+def cache_key(text: str, sentence_count: int, version: str) -> str:
+    """Hash the cleaned text together with everything that affects the output."""
+    digest = hashlib.sha256()
+    digest.update(f"{version}\0{sentence_count}\0".encode("utf-8"))
+    digest.update(text.encode("utf-8", errors="surrogatepass"))
+    return digest.hexdigest()
+
+
+class SummaryCache:
+    """SQLite store of key points with least-recently-used eviction.
+
+    Entries are keyed by a hash of the cleaned text, the sentence count and
+    the summarizer version, so changing any of them misses the cache.
+    """
+
+    def __init__(self, path: Path, max_entries: int = DEFAULT_MAX_ENTRIES):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.max_entries = max_entries
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._pending_writes = 0
+
+    def get(self, text: str, sentence_count: int, version: str) -> list[str] | None:
+        """Return cached key points, or None on a miss."""
+        key = cache_key(text, sentence_count, version)
+        row = self._conn.execute(
+            "SELECT key_points FROM summaries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        self._conn.execute(
+            "UPDATE summaries SET last_used = ? WHERE key = ?", (time.time(), key)
+        )
+        self._note_write()
+        return json.loads(row[0])
+
+    def put(self, text: str, sentence_count: int, version: str, key_points: list[str]) -> None:
+        """Store key points for the given text."""
+        key = cache_key(text, sentence_count, version)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO summaries (key, key_points, last_used) VALUES (?, ?, ?)",
+            (key, json.dumps(key_points), time.time()),
+        )
+        self._note_write()
+
+    def _note_write(self) -> None:
+        self._pending_writes += 1
+        if self._pending_writes >= _COMMIT_INTERVAL:
+            self.flush()
+
+    def _evict(self) -> None:
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM summaries").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM summaries WHERE key IN "
+                "(SELECT key FROM summaries ORDER BY last_used LIMIT ?)",
+                (excess,),
+            )
+            logger.info("Evicted %d summary cache entries", excess)
+
+    def flush(self) -> None:
+        """Evict old entries if over the limit and commit pending writes."""
+        self._evict()
+        self._conn.commit()
+        self._pending_writes = 0
+
+    def close(self) -> None:
+        """Flush and close the database."""
+        self.flush()
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,214 @@
+"""Client-side rate limiting and retries for remote APIs shared by several threads."""
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Collection
+
+from .utils import get_logger
+
+logger = get_logger(__name__)
+
+# Attempts per call, including the first, before the last error is raised
+MAX_ATTEMPTS = 6
+
+# Retry n waits a random time of up to BACKOFF_BASE * 2**n seconds
+# ("full jitter"), capped at BACKOFF_MAX
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30.0
+
+# When throttled, the rate is multiplied by SLOW_DOWN_FACTOR (but kept at or
+# above MIN_RATE_SHARE of the configured rate); each success then adds back
+# SPEED_UP_SHARE of the configured rate
+SLOW_DOWN_FACTOR = 0.5
+MIN_RATE_SHARE = 0.1
+SPEED_UP_SHARE = 0.05
+
+
+def backoff_delay(attempt: int) -> float:
+    """Jittered exponential backoff before retry number *attempt* (from 0)."""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delay-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimiter:
+    """Token bucket allowing *rate* calls per second on average.
+
+    Up to *burst* calls may go out back to back after an idle period.
+    acquire() is safe to call from several threads; each call blocks until
+    a token is free.
+
+    The rate adapts to the server: slow_down() cuts it when a call was
+    throttled and speed_up() raises it back towards the configured rate
+    after each success. pause() holds every caller until a server-given
+    time has passed.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._resume_at:
+                    wait = self._resume_at - now
+                else:
+                    self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller for *seconds*, then resume without a burst."""
+        with self._lock:
+            resume_at = time.monotonic() + seconds
+            if resume_at > self._resume_at:
+                self._resume_at = resume_at
+                self._updated = resume_at
+                self._tokens = 0.0
+
+    def slow_down(self) -> None:
+        """Cut the rate after the server throttled a call."""
+        with self._lock:
+            self.rate = max(self.max_rate * MIN_RATE_SHARE, self.rate * SLOW_DOWN_FACTOR)
+        logger.info("Throttled by the server; slowing down to %.2f requests/s", self.rate)
+
+    def speed_up(self) -> None:
+        """Raise the rate a step back towards the configured rate."""
+        if self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * SPEED_UP_SHARE)
+
+
+@dataclass
+class RetryAdvice:
+    """How to retry a failed call: returned by a client's error classifier.
+
+    *may_have_applied* is set when the server may have carried out the call
+    despite the error (a server error or a lost response), so it is only
+    repeated if repeating it is harmless.
+    """
+    throttled: bool = False
+    retry_after: float | None = None
+    may_have_applied: bool = False
+
+
+class _ThrottledEndpoint:
+    def __init__(self, endpoint, owner: "ThrottledClient", path: str):
+        self._endpoint = endpoint
+        self._owner = owner
+        self._path = path
+
+    def __getattr__(self, name):
+        return self._owner._wrap(getattr(self._endpoint, name), f"{self._path}.{name}")
+
+
+class ThrottledClient:
+    """Wrap an API client so every endpoint call waits on a RateLimiter.
+
+    Endpoints are reached as attributes (``client.pages.create(...)``), as
+    in notion-client, and may be nested (``client.blocks.children``); each
+    method call, on the client itself or on any endpoint, takes one token
+    first.
+
+    Failed calls are retried when *classify* returns a RetryAdvice for the
+    error (None means the error is permanent), up to *max_attempts* in
+    all. A throttled call slows the shared limiter down and pauses it for
+    the server's Retry-After, or for a jittered backoff if none was given.
+    Other transient errors back off in the calling thread only.
+
+    Methods named in *unsafe* by their dotted path (``"pages.create"``)
+    are not idempotent: they are not retried after an error that may have
+    left the call applied, and the caller decides how to recover.
+    """
+
+    def __init__(
+        self,
+        client,
+        limiter: RateLimiter,
+        *,
+        classify: Callable[[Exception], RetryAdvice | None] | None = None,
+        max_attempts: int = MAX_ATTEMPTS,
+        unsafe: Collection[str] = (),
+    ):
+        self.client = client
+        self.limiter = limiter
+        self.classify = classify
+        self.max_attempts = max_attempts
+        self.unsafe = frozenset(unsafe)
+
+    def call(self, method, /, *args, **kwargs):
+        """Call *method* within the rate limit, retrying transient errors."""
+        return self._call(method, True, args, kwargs)
+
+    def _call(self, method, idempotent: bool, args, kwargs):
+        for attempt in range(self.max_attempts):
+            self.limiter.acquire()
+            try:
+                result = method(*args, **kwargs)
+            except Exception as e:
+                advice = self.classify(e) if self.classify else None
+                if advice is None or attempt == self.max_attempts - 1:
+                    raise
+                if advice.may_have_applied and not idempotent:
+                    raise
+                if advice.throttled:
+                    self.limiter.slow_down()
+                delay = advice.retry_after
+                if delay is None:
+                    delay = backoff_delay(attempt)
+                logger.warning(
+                    "%s failed (%s); retrying in %.1fs (attempt %d of %d)",
+                    getattr(method, "__qualname__", method), e, delay, attempt + 2, self.max_attempts,
+                )
+                if advice.throttled:
+                    self.limiter.pause(delay)
+                else:
+                    time.sleep(delay)
+                continue
+            self.limiter.speed_up()
+            return result
+
+    def _wrap(self, value, path: str):
+        """Route methods through call() and wrap endpoint objects."""
+        if callable(value):
+            idempotent = path not in self.unsafe
+            return lambda *args, **kwargs: self._call(value, idempotent, args, kwargs)
+        if isinstance(value, (str, bytes, int, float, bool, type(None), dict, list, tuple)):
+            return value
+        return _ThrottledEndpoint(value, self, path)
+
+    def __getattr__(self, name):
+        return self._wrap(getattr(self.client, name), name)
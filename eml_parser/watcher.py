@@ -0,0 +1,177 @@
+"""Watch a directory for .eml files as they finish arriving."""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Iterator
+
+from .utils import get_logger
+
+logger = get_logger(__name__)
+
+# Seconds between directory scans when inotify is unavailable
+POLL_INTERVAL = 0.5
+
+# With inotify, the directory is still rescanned this often in case an
+# event was missed (e.g. the kernel queue overflowed)
+RESCAN_INTERVAL = 30.0
+
+# inotify event flags (from <sys/inotify.h>)
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+
+# struct inotify_event: int wd; uint32_t mask, cookie, len; char name[len]
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _open_inotify(directory: Path) -> int | None:
+    """Return an inotify descriptor watching *directory*, or None if unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    if libc.inotify_add_watch(fd, os.fsencode(directory), _WATCH_MASK) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+class DirectoryWatcher:
+    """Yield batches of .eml files in a directory once they are complete.
+
+    A file is ready once its size and modification time are unchanged
+    between two scans and it has not been modified for *poll_interval*
+    seconds. On Linux, inotify also makes a file ready as soon as the
+    writer has closed it or it was moved in, provided it has not been
+    written since; files inotify reports as open for writing are never
+    ready. Elsewhere the directory is polled.
+
+    Files already in the directory are yielded once they are stable. A
+    file is yielded again only if it changes, so files left behind (e.g.
+    unparseable ones) are not retried forever.
+    """
+
+    def __init__(self, directory: Path, *, poll_interval: float = POLL_INTERVAL, use_inotify: bool = True):
+        self.directory = directory
+        self.poll_interval = poll_interval
+        self._fd = _open_inotify(directory) if use_inotify else None
+        self._writing: set[str] = set()  # inotify: files written to, not yet closed
+        self._closed: set[str] = set()  # inotify: files closed or moved in, not written since
+        self._last_seen: dict[Path, tuple[int, int]] = {}  # (size, mtime) at the last scan
+        self._yielded: dict[Path, tuple[int, int]] = {}
+        self._unready = False  # the last scan found files not ready yet
+        if self._fd is None:
+            logger.info("Polling %s every %.1fs", directory, poll_interval)
+        else:
+            logger.info("Watching %s with inotify", directory)
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self._fd is not None
+
+    def _read_events(self) -> None:
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return
+            offset = 0
+            while offset < len(data):
+                _wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+                offset += length
+                if mask & (_IN_CREATE | _IN_MODIFY):
+                    self._writing.add(name)
+                    self._closed.discard(name)
+                elif mask & (_IN_CLOSE_WRITE | _IN_MOVED_TO):
+                    self._writing.discard(name)
+                    self._closed.add(name)
+                elif mask & (_IN_MOVED_FROM | _IN_DELETE):
+                    self._writing.discard(name)
+                    self._closed.discard(name)
+
+    def _wait(self) -> None:
+        if self._fd is None:
+            time.sleep(self.poll_interval)
+            return
+        # Rescan sooner while any file is still being written or settling
+        timeout = self.poll_interval if self._writing or self._unready else RESCAN_INTERVAL
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if ready:
+            self._read_events()
+
+    def ready_files(self) -> list[Path]:
+        """Scan the directory once and return complete, not yet yielded files."""
+        paths = sorted(self.directory.glob("*.eml"))
+        if self._fd is not None:
+            # Events for every file found are queued by now
+            self._read_events()
+        seen = {}
+        now = time.time()
+        for path in paths:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            seen[path] = (stat.st_size, stat.st_mtime_ns)
+        if self._fd is not None:
+            # A write after the stat shows up here and keeps the file back
+            self._read_events()
+
+        ready = []
+        self._unready = False
+        for path, signature in seen.items():
+            if self._yielded.get(path) == signature:
+                continue
+            age = now - signature[1] / 1e9
+            complete = self._last_seen.get(path) == signature and age >= self.poll_interval
+            if self._fd is not None:
+                if path.name in self._writing:
+                    complete = False
+                elif path.name in self._closed:
+                    complete = True
+            if complete:
+                ready.append(path)
+                self._yielded[path] = signature
+            else:
+                self._unready = True
+
+        # Forget files that have been moved away
+        self._last_seen = seen
+        self._yielded = {path: sig for path, sig in self._yielded.items() if path in seen}
+        return ready
+
+    def __iter__(self) -> Iterator[list[Path]]:
+        while True:
+            files = self.ready_files()
+            if files:
+                yield files
+            else:
+                self._wait()
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()